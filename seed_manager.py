@@ -3,10 +3,51 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import csv
 import os
+import argparse
 import datetime
+import math
+import tempfile
+import queue
+import heapq
+import mmap
+import struct
+import json
+import hashlib
+import asyncio
+import threading
+import zlib
+import multiprocessing
+from urllib.parse import urlsplit, parse_qs, unquote
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 CSV_FILE = "seed_list.csv"
 
+# compiled, read-only reference catalogs (see compile_catalog / BinaryCatalog)
+REFERENCE_FILE = "reference.seedcat"
+REFERENCE_LIST_LIMIT = 500
+
+# optional local JSON service (python seed_manager.py --serve)
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_PAGE_SIZE = 50
+SERVICE_MAX_PAGE_SIZE = 500
+SERVICE_CACHE_SIZE = 128  # serialized responses kept, least recently used dropped first
+# query parameters each endpoint reads; anything else is ignored, also for caching
+SERVICE_ROUTE_PARAMS = {"/seeds": ("page", "per_page"),
+                        "/query": ("season", "pairing", "type", "page", "per_page")}
+
+# versioned catalog history, kept next to each catalog file
+SNAPSHOT_DIR = ".seed_snapshots"
+SNAPSHOT_FANOUT = 16  # average rows (or child nodes) per content-defined block
+# content hash cached on a row the first time it is snapshotted, tagged with
+# the row's id() so a dict(row, ...) copy never reuses its original's hash
+SNAPSHOT_HASH_KEY = "_row_hash"
+
+# rows loaded from a catalog remember which file they came from under this key;
+# it is never written back out because writers only emit COLUMNS
+SOURCE_KEY = "_source"
+
 COLUMNS = [
     "Name", "Type", "Life Cycle", "Germination (days)",
     "Seed Spacing (inches)", "Temperature (F)", "Seed Depth (inches)",
@@ -34,17 +75,1085 @@ COLORS = {
 
 LONG_TEXT_COLUMNS = {"Comments", "Benefits", "Uses", "Issues", "Pairings"}
 
+# paragraph columns kept out of the in-memory rows (Pairings stays inline, the
+# companion graph and filters need it); a row whose text in these columns is
+# long enough to be worth it holds previews plus one side-file ref
+OFFLINE_TEXT_COLUMNS = ("Benefits", "Uses", "Issues", "Comments")
+TEXT_REF_KEY = "_text_ref"
+PREVIEW_CHARS = 60
+OFFLINE_TEXT_MIN = 512
+
+# background queries: how often a worker checks whether it was superseded, how
+# often the UI looks for finished results, and how many rows go into the table
+# per Tk callback
+QUERY_CHECK_EVERY = 2048
+QUERY_POLL_MS = 20
+TABLE_BATCH = 400
+
+# upcoming transplant / harvest reminders
+SCHEDULE_TICK_MS = 60_000
+SCHEDULE_LOOKAHEAD_DAYS = 7
+SCHEDULE_MAX_DAYS = 3650    # longest transplant / maturity span taken seriously
+SCHEDULE_STALE_DAYS = 60    # derived reminders older than this are treated as done
+DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d")
+
+# ---------- catalog files ----------
+def read_catalog(path):
+    # runs inside a worker process when several catalogs are opened at once;
+    # rows come back as value lists in COLUMNS order, which are much cheaper to
+    # send between processes than dicts that repeat every column name
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        where = [header.index(col) if col in header else -1 for col in COLUMNS]
+        return [[r[i] if 0 <= i < len(r) else "" for i in where] for r in reader if r]
+
+def load_catalogs(paths):
+    workers = min(len(paths), os.cpu_count() or 1)
+    if workers <= 1:
+        # one worker would only add process start-up to a sequential read
+        results = [read_catalog(p) for p in paths]
+    else:
+        # spawn, not fork: by now this process has Tk and worker threads running
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(read_catalog, paths))
+    data = []
+    for path, values in zip(paths, results):
+        for v in values:
+            row = dict(zip(COLUMNS, v))
+            row[SOURCE_KEY] = path
+            data.append(row)
+    return data
+
+def write_catalog(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+def site_label(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+# ---------- compiled binary catalogs ----------
+# Layout (little endian):
+#   header      magic, version, column count, row count, then offsets of the
+#               column names, the dictionary directory and the row-offset table
+#   columns     per column: u16 length + utf-8 name
+#   directory   per column: u64 offset of that column's dictionary
+#   dictionary  u32 count, count+1 u32 offsets into the blob, utf-8 blob
+#   row table   per row: u64 offset of its record
+#   records     per row: one u32 dictionary code per column
+BIN_MAGIC = b"SEEDCAT\0"
+BIN_VERSION = 1
+BIN_HEADER = struct.Struct("<8sHHIQQQ")
+
+def compile_catalog(csv_path, out_path):
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    ncols = len(COLUMNS)
+    dictionaries = [{"": 0} for _ in COLUMNS]
+    records = []
+    for r in rows:
+        codes = []
+        for c, col in enumerate(COLUMNS):
+            d = dictionaries[c]
+            codes.append(d.setdefault(r.get(col) or "", len(d)))
+        records.append(struct.pack(f"<{ncols}I", *codes))
+
+    columns = b"".join(struct.pack("<H", len(n)) + n for n in (col.encode('utf-8') for col in COLUMNS))
+    columns_off = BIN_HEADER.size
+    directory_off = columns_off + len(columns)
+    dict_blocks = []
+    pos = directory_off + 8 * ncols
+    dict_offsets = []
+    for d in dictionaries:
+        encoded = [v.encode('utf-8') for v in d]  # dicts keep insertion (= code) order
+        offsets = [0]
+        for e in encoded:
+            offsets.append(offsets[-1] + len(e))
+        block = struct.pack(f"<I{len(offsets)}I", len(encoded), *offsets) + b"".join(encoded)
+        dict_offsets.append(pos)
+        dict_blocks.append(block)
+        pos += len(block)
+    rows_off = pos
+    record_off = rows_off + 8 * len(records)
+    row_table = struct.pack(f"<{len(records)}Q", *(record_off + i * 4 * ncols for i in range(len(records))))
+
+    with open(out_path, 'wb') as f:
+        f.write(BIN_HEADER.pack(BIN_MAGIC, BIN_VERSION, ncols, len(records), columns_off, directory_off, rows_off))
+        f.write(columns)
+        f.write(struct.pack(f"<{ncols}Q", *dict_offsets))
+        for block in dict_blocks:
+            f.write(block)
+        f.write(row_table)
+        for rec in records:
+            f.write(rec)
+    return len(records)
+
+class BinaryCatalog:
+    # Read-only view over a compiled catalog. The file is mapped, not read, and
+    # a row is only decoded when someone asks for it.
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = None
+        try:
+            # mmap refuses empty files with ValueError
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_layout()
+        except (ValueError, struct.error, UnicodeDecodeError) as e:
+            self.close()
+            raise ValueError(f"{path} is not a valid compiled seed catalog") from e
+        self._name_rows = None
+        self._name_codes = {}
+
+    def _read_layout(self):
+        size = len(self._mm)
+        if size < BIN_HEADER.size:
+            raise ValueError("file is shorter than the header")
+        magic, version, ncols, nrows, columns_off, directory_off, rows_off = BIN_HEADER.unpack_from(self._mm, 0)
+        if magic != BIN_MAGIC or version != BIN_VERSION:
+            raise ValueError("bad magic or version")
+        if (columns_off < BIN_HEADER.size or directory_off + 8 * ncols > size
+                or rows_off + 8 * nrows > size):
+            raise ValueError("section offsets out of bounds")
+        self._size = size
+        self._ncols = ncols
+        self._nrows = nrows
+        self._rows_off = rows_off
+        self._record = struct.Struct(f"<{ncols}I")
+        names = []
+        pos = columns_off
+        for _ in range(ncols):
+            (n,) = struct.unpack_from("<H", self._mm, pos)
+            if pos + 2 + n > size:
+                raise ValueError("column name out of bounds")
+            names.append(bytes(self._mm[pos + 2:pos + 2 + n]).decode('utf-8'))
+            pos += 2 + n
+        self.columns = names
+        self._dicts = struct.unpack_from(f"<{ncols}Q", self._mm, directory_off)
+        for off in self._dicts:
+            if off + 4 > size:
+                raise ValueError("dictionary out of bounds")
+            (count,) = struct.unpack_from("<I", self._mm, off)
+            if off + 4 + 4 * (count + 1) > size:
+                raise ValueError("dictionary out of bounds")
+        self._name_col = names.index("Name") if "Name" in names else None
+
+    def __len__(self):
+        return self._nrows
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def value(self, col, code):
+        off = self._dicts[col]
+        (count,) = struct.unpack_from("<I", self._mm, off)
+        if code >= count:
+            raise ValueError(f"{self.path}: dictionary code out of range")
+        start, end = struct.unpack_from("<II", self._mm, off + 4 + 4 * code)
+        blob = off + 4 + 4 * (count + 1)
+        if not start <= end <= self._size - blob:
+            raise ValueError(f"{self.path}: dictionary entry out of bounds")
+        return bytes(self._mm[blob + start:blob + end]).decode('utf-8')
+
+    def _codes(self, index):
+        (rec,) = struct.unpack_from("<Q", self._mm, self._rows_off + 8 * index)
+        if rec + self._record.size > self._size:
+            raise ValueError(f"{self.path}: row record out of bounds")
+        return self._record.unpack_from(self._mm, rec)
+
+    def row(self, index):
+        codes = self._codes(index)
+        row = {col: "" for col in COLUMNS}
+        for c, name in enumerate(self.columns):
+            if name in row:
+                row[name] = self.value(c, codes[c])
+        return row
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._nrows:
+            raise IndexError(index)
+        return self.row(index)
+
+    def names(self, query="", limit=None):
+        # walks the Name dictionary, so duplicate names are only decoded once
+        if self._name_col is None:
+            return []
+        off = self._dicts[self._name_col]
+        (count,) = struct.unpack_from("<I", self._mm, off)
+        q = query.strip().lower()
+        out = []
+        for code in range(1, count):
+            name = self.value(self._name_col, code)
+            if q in name.lower():
+                out.append(name)
+                if limit is not None and len(out) >= limit:
+                    break
+        return out
+
+    def find(self, name):
+        if self._name_col is None:
+            return None
+        if self._name_rows is None:
+            # name code -> first row index, built from the code column only
+            self._name_rows = {}
+            for i in range(self._nrows):
+                self._name_rows.setdefault(self._codes(i)[self._name_col], i)
+        code = self._name_codes.get(name)
+        if code is None:
+            off = self._dicts[self._name_col]
+            (count,) = struct.unpack_from("<I", self._mm, off)
+            for c in range(count):
+                if self.value(self._name_col, c) == name:
+                    code = self._name_codes[name] = c
+                    break
+        index = self._name_rows.get(code)
+        return None if index is None else self.row(index)
+
+# ---------- long text side file ----------
+def preview(text):
+    if len(text) <= PREVIEW_CHARS:
+        return text
+    return " ".join(text[:PREVIEW_CHARS].split()) + "…"
+
+class TextStore:
+    # Append-only scratch file holding the full text of long fields for this
+    # session. All of a row's offloaded fields are written as one JSON blob and
+    # the row keeps a single int, offset << 32 | length, to fetch it on demand.
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._end = 0
+        # the JSON service reads from its own thread
+        self._lock = threading.Lock()
+
+    def put(self, fields):
+        data = json.dumps(fields, ensure_ascii=False).encode('utf-8')
+        with self._lock:
+            self._file.seek(self._end)
+            self._file.write(data)
+            ref = (self._end << 32) | len(data)
+            self._end += len(data)
+        return ref
+
+    def get(self, ref):
+        with self._lock:
+            self._file.seek(ref >> 32)
+            data = self._file.read(ref & 0xFFFFFFFF)
+        return json.loads(data.decode('utf-8'))
+
+    def externalize(self, row):
+        row.pop(TEXT_REF_KEY, None)
+        fields = {col: row[col] for col in OFFLINE_TEXT_COLUMNS if len(row.get(col) or "") > PREVIEW_CHARS}
+        if sum(len(t) for t in fields.values()) < OFFLINE_TEXT_MIN:
+            return row
+        row[TEXT_REF_KEY] = self.put(fields)
+        for col, text in fields.items():
+            row[col] = preview(text)
+        return row
+
+    def fetch(self, row, col):
+        ref = row.get(TEXT_REF_KEY)
+        if ref is None or col not in OFFLINE_TEXT_COLUMNS:
+            return row.get(col, "")
+        return self.get(ref).get(col, row.get(col, ""))
+
+    def expand(self, row):
+        # full copy of a row for writing back to disk
+        ref = row.get(TEXT_REF_KEY)
+        if ref is None:
+            return row
+        full = dict(row)
+        full.update(self.get(ref))
+        return full
+
+# ---------- background queries ----------
+def filter_rows(rows, keep, cancelled):
+    out = []
+    for i, r in enumerate(rows):
+        if i % QUERY_CHECK_EVERY == 0 and cancelled():
+            return None
+        if keep(r):
+            out.append(r)
+    return out
+
+def sort_rows(rows, key, cancelled):
+    if cancelled():
+        return None
+    return sorted(rows, key=key)
+
+# ---------- companion planting graph ----------
+def pair_key(text):
+    # normalize a seed name / pairing term so "Tomatoes" and "tomato" meet
+    s = " ".join(text.strip().lower().split())
+    if len(s) > 3:
+        if s.endswith(("oes", "ches", "shes")):
+            s = s[:-2]
+        elif s.endswith("s") and not s.endswith("ss"):
+            s = s[:-1]
+    return s
+
+def split_pairings(text):
+    return {pair_key(p) for p in text.split(',') if p.strip()}
+
+def sown_in(row, year):
+    # True when one of the record's Seed Started Dates falls in `year`
+    suffix = str(year)
+    return any(d.strip().endswith(suffix) for d in row.get("Seed Started Date", "").split(','))
+
+class PairingGraph:
+    # Two seeds are compatible when either one lists the other's name or Type
+    # under Pairings. Only the key indexes are kept up to date per record;
+    # neighbour sets are worked out from them on first use and remembered, and
+    # an edit forgets just the edited seed, its neighbours and the cached
+    # answers that involve them.
+    def __init__(self, rows=()):
+        self._rows = {}         # name -> records carrying that name
+        self._declared = {}     # name -> pairing keys it lists
+        self._aliases = {}      # name -> keys it answers to (name, type)
+        self._declared_by = {}  # key -> names listing it
+        self._known_as = {}     # key -> names answering to it
+        self._adj = {}          # name -> compatible names, filled on demand
+        self._cache = {}        # query key -> (names it depends on, answer)
+        self.version = 0
+        for row in rows:
+            name = row.get("Name", "").strip()
+            if name:
+                self._rows.setdefault(name, []).append(row)
+        for name in self._rows:
+            self._reindex_name(name)
+
+    def add(self, row):
+        name = row.get("Name", "").strip()
+        if not name:
+            return
+        self._rows.setdefault(name, []).append(row)
+        self._refresh(name)
+
+    def remove(self, row):
+        name = row.get("Name", "").strip()
+        rows = self._rows.get(name)
+        if not rows:
+            return
+        for i, r in enumerate(rows):
+            if r is row:
+                del rows[i]
+                break
+        else:
+            return
+        if not rows:
+            del self._rows[name]
+        self._refresh(name)
+
+    def update(self, old, new):
+        if old is not None:
+            self.remove(old)
+        if new is not None:
+            self.add(new)
+
+    def _reindex(self, index, name, old_keys, new_keys):
+        for k in old_keys - new_keys:
+            names = index.get(k)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del index[k]
+        for k in new_keys - old_keys:
+            index.setdefault(k, set()).add(name)
+
+    def _reindex_name(self, name):
+        rows = self._rows.get(name, [])
+        declared = set()
+        aliases = set()
+        for r in rows:
+            declared |= split_pairings(r.get("Pairings", ""))
+            aliases.update(k for k in (pair_key(name), pair_key(r.get("Type", ""))) if k)
+        self._reindex(self._declared_by, name, self._declared.pop(name, set()), declared)
+        self._reindex(self._known_as, name, self._aliases.pop(name, set()), aliases)
+        if rows:
+            self._declared[name] = declared
+            self._aliases[name] = aliases
+
+    def _refresh(self, name):
+        # compatibility is symmetric, so only the old and new partners move
+        before = self.neighbours(name)
+        self._reindex_name(name)
+        self._adj.pop(name, None)
+        after = self.neighbours(name)
+        affected = before | after | {name}
+        for n in affected:
+            self._adj.pop(n, None)
+        if self._cache:
+            self._cache = {k: v for k, v in self._cache.items() if not (v[0] & affected)}
+        self.version += 1
+
+    def neighbours(self, name):
+        adj = self._adj.get(name)
+        if adj is None:
+            found = set()
+            for k in self._declared.get(name, ()):
+                found |= self._known_as.get(k, set())
+            for k in self._aliases.get(name, ()):
+                found |= self._declared_by.get(k, set())
+            found.discard(name)
+            adj = self._adj[name] = frozenset(found)
+        return adj
+
+    def _score(self, name):
+        # cheap stand-in for degree, read straight off the key indexes
+        return (sum(len(self._known_as.get(k, ())) for k in self._declared.get(name, ()))
+                + sum(len(self._declared_by.get(k, ())) for k in self._aliases.get(name, ())))
+
+    def _cached(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key][1]
+
+    def __contains__(self, name):
+        return name in self._declared
+
+    def snapshot(self):
+        # read-only copy that a worker thread can query while edits continue here
+        copy = PairingGraph()
+        copy._declared = dict(self._declared)
+        copy._aliases = dict(self._aliases)
+        copy._declared_by = {k: frozenset(v) for k, v in self._declared_by.items()}
+        copy._known_as = {k: frozenset(v) for k, v in self._known_as.items()}
+        copy._adj = dict(self._adj)
+        copy.version = self.version
+        return copy
+
+    def partners(self, name):
+        return self._cached(("partners", name),
+                            lambda: ({name}, sorted(self.neighbours(name), key=str.lower)))
+
+    def compatible_with_all(self, names):
+        names = tuple(sorted(n for n in set(names) if n in self))
+        def compute():
+            if not names:
+                return set(), []
+            common = frozenset.intersection(*(self.neighbours(n) for n in names)) - set(names)
+            return set(names), sorted(common, key=str.lower)
+        return self._cached(("all", names), compute)
+
+    def _grow_bed(self, members, pool=None):
+        # greedy clique: take candidates in order of how widely they pair
+        bed = list(members)
+        cands = set(self.neighbours(bed[0]))
+        for n in bed[1:]:
+            cands &= self.neighbours(n)
+        if pool is not None:
+            cands &= pool
+        considered = set(cands)
+        for c in sorted(cands, key=lambda c: (-self._score(c), c.lower())):
+            if c in cands:
+                bed.append(c)
+                cands &= self.neighbours(c)
+        return bed, considered
+
+    def bed_for(self, names):
+        names = tuple(sorted(n for n in set(names) if n in self))
+        def compute():
+            if not names:
+                return set(), []
+            bed, considered = self._grow_bed(names)
+            return set(names) | considered, bed
+        return self._cached(("bed", names), compute)
+
+    def suggest_beds(self, count, names=None):
+        # touches the whole catalog; the app runs it on a snapshot off the Tk thread
+        pool = {n for n in (names if names is not None else self._declared) if n in self}
+        order = sorted(pool, key=lambda n: (-self._score(n), n.lower()))
+        beds = []
+        for start in order:
+            if len(beds) >= count:
+                break
+            if start not in pool:
+                continue
+            bed, _ = self._grow_bed([start], pool)
+            beds.append(bed)
+            pool -= set(bed)
+        return beds
+
+# ---------- catalog statistics ----------
+def parse_range(text):
+    # "7-14" -> (7.0, 14.0), "70" -> (70.0, 70.0), anything else -> None
+    parts = [p.strip() for p in text.split('-', 1)]
+    try:
+        nums = [float(p) for p in parts if p]
+    except ValueError:
+        return None
+    if not nums:
+        return None
+    return min(nums), max(nums)
+
+def has_value(text):
+    # placeholder values such as "//" count as empty
+    return any(ch.isalnum() for ch in text)
+
+def heirloom_label(text):
+    v = text.strip().lower()
+    if v in ("y", "yes"):
+        return "Yes"
+    if v in ("n", "no"):
+        return "No"
+    return "Unknown"
+
+class CatalogStats:
+    # Running aggregates over the catalog. Every add / edit / delete adjusts the
+    # counters for that one record, so rendering the panel never walks self.data.
+    def __init__(self, rows=()):
+        self.total = 0
+        self.by_type = Counter()
+        self.by_life_cycle = Counter()
+        self.by_season = Counter()
+        self.by_heirloom = Counter()
+        self.progress = Counter()
+        self.germination = {}  # type -> [count, sum of mins, sum of maxes]
+        self.maturity = {}
+        for row in rows:
+            self.add(row)
+
+    def add(self, row):
+        self._apply(row, 1)
+
+    def remove(self, row):
+        self._apply(row, -1)
+
+    def update(self, old, new):
+        if old is not None:
+            self.remove(old)
+        if new is not None:
+            self.add(new)
+
+    def _apply(self, row, sign):
+        kind = row.get("Type", "").strip() or "(none)"
+        self.total += sign
+        self.by_type[kind] += sign
+        self.by_life_cycle[row.get("Life Cycle", "").strip() or "(none)"] += sign
+        self.by_heirloom[heirloom_label(row.get("Heirloom (Y/N)", ""))] += sign
+        for season in {s.strip() for s in row.get("Season/s", "").split(',') if s.strip()}:
+            self.by_season[season] += sign
+        for col, key in (("Seed Started Date", "Started"), ("Transplant Date", "Transplanted"), ("Harvest Date", "Harvested")):
+            if has_value(row.get(col, "")):
+                self.progress[key] += sign
+        for col, sums in (("Germination (days)", self.germination), ("Time to Maturity", self.maturity)):
+            rng = parse_range(row.get(col, ""))
+            if rng is None:
+                continue
+            entry = sums.setdefault(kind, [0, 0.0, 0.0])
+            entry[0] += sign
+            entry[1] += sign * rng[0]
+            entry[2] += sign * rng[1]
+            if entry[0] <= 0:
+                del sums[kind]
+
+    def averages(self, sums):
+        return {kind: (mn / n, mx / n) for kind, (n, mn, mx) in sums.items() if n > 0}
+
+    def summary_lines(self):
+        def counts(title, counter):
+            lines = [title]
+            for k, v in sorted(counter.items(), key=lambda kv: (-kv[1], kv[0].lower())):
+                if v > 0:
+                    lines.append(f"  {k}: {v}")
+            return lines + [""]
+
+        lines = [f"Total seeds: {self.total}", ""]
+        lines += counts("By Type", self.by_type)
+        lines += counts("By Life Cycle", self.by_life_cycle)
+        lines += counts("By Season", self.by_season)
+        lines += counts("Heirloom", self.by_heirloom)
+        lines.append("Progress")
+        for key in ("Started", "Transplanted", "Harvested"):
+            lines.append(f"  {key}: {self.progress[key]}")
+        lines.append("")
+        germ = self.averages(self.germination)
+        mat = self.averages(self.maturity)
+        lines.append("Average ranges by Type (days)")
+        for kind in sorted(set(germ) | set(mat), key=str.lower):
+            parts = []
+            if kind in germ:
+                parts.append("germination {:.0f}-{:.0f}".format(*germ[kind]))
+            if kind in mat:
+                parts.append("maturity {:.0f}-{:.0f}".format(*mat[kind]))
+            lines.append(f"  {kind}: " + ", ".join(parts))
+        return lines
+
+# ---------- planting schedule ----------
+def parse_date(text):
+    text = text.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, fmt).date()
+        except ValueError:
+            pass
+    return None
+
+def latest_date(text):
+    dates = [d for d in (parse_date(p) for p in text.split(',')) if d is not None]
+    return max(dates) if dates else None
+
+def record_key(row):
+    # names can repeat within a catalog, so reminders follow the row object itself;
+    # an edit swaps in a new row and retires the old one
+    return id(row)
+
+def schedule_days(value):
+    # day counts from free-form catalog fields; nan, inf and absurd spans are ignored
+    if value is None or not math.isfinite(value) or not 0 <= value <= SCHEDULE_MAX_DAYS:
+        return None
+    return int(value)
+
+def add_days(base, days):
+    try:
+        return base + datetime.timedelta(days=days)
+    except (OverflowError, ValueError):
+        return None
+
+def planting_events(row, today):
+    # (due date, kind) pairs derived from a record's dates. Dates typed into
+    # Transplant / Harvest Date only matter while they are still ahead; otherwise
+    # the due date is worked out from when the seed was started. Worked-out
+    # dates more than SCHEDULE_STALE_DAYS in the past are assumed handled.
+    events = []
+    started = latest_date(row.get("Seed Started Date", ""))
+    transplanted = parse_date(row.get("Transplant Date", ""))
+    harvested = parse_date(row.get("Harvest Date", ""))
+    stale = today - datetime.timedelta(days=SCHEDULE_STALE_DAYS)
+
+    expected_transplant = None
+    if transplanted is None and started is not None:
+        # "6-8" weeks counts from the earliest, like Time to Maturity below
+        weeks = parse_range(row.get("Transplant Timeframe (weeks)", ""))
+        days = schedule_days(weeks[0] * 7) if weeks is not None else None
+        if days:
+            expected_transplant = add_days(started, days)
+
+    # a recorded harvest means the transplant step is over (or never happened)
+    if harvested is None:
+        if transplanted is not None:
+            if transplanted >= today:
+                events.append((transplanted, "Transplant"))
+        elif expected_transplant is not None and expected_transplant >= stale:
+            events.append((expected_transplant, "Transplant"))
+
+    if harvested is not None:
+        if harvested >= today:
+            events.append((harvested, "Harvest"))
+    else:
+        base = transplanted or expected_transplant or started
+        maturity = parse_range(row.get("Time to Maturity", ""))
+        days = schedule_days(maturity[0]) if maturity is not None else None
+        due = add_days(base, days) if base is not None and days is not None else None
+        if due is not None and due >= stale:
+            events.append((due, "Harvest"))
+    return events
+
+class PlantingScheduler:
+    # Min-heap of upcoming events. Each add stamps the record's entries with a
+    # fresh version, so entries left behind by an edit or delete are skipped
+    # when they surface instead of being searched for.
+    def __init__(self, rows=(), today=None):
+        self._heap = []
+        self._version = {}  # key -> stamp of its live heap entries
+        self._pending = {}  # key -> live heap entries for that record
+        self._rows = {}     # key -> record, for records with live entries
+        self._live = 0
+        self._seq = 0
+        self.today = today or datetime.date.today()
+        for row in rows:
+            self.add(row)
+
+    def _invalidate(self, key):
+        self._live -= self._pending.pop(key, 0)
+        self._version.pop(key, None)
+        self._rows.pop(key, None)
+
+    def add(self, row):
+        key = record_key(row)
+        self._invalidate(key)
+        events = planting_events(row, self.today)
+        if events:
+            # stamps come from the same counter as entries, so they are never reused
+            self._seq += 1
+            version = self._version[key] = self._seq
+            self._rows[key] = row
+            for due, kind in events:
+                self._seq += 1
+                heapq.heappush(self._heap, (due, self._seq, key, version, kind))
+            self._pending[key] = len(events)
+            self._live += len(events)
+        self._compact()
+
+    def remove(self, row):
+        self._invalidate(record_key(row))
+
+    def update(self, old, new):
+        if old is not None:
+            self.remove(old)
+        if new is not None:
+            self.add(new)
+
+    def _compact(self):
+        # drop stale entries once they outnumber the live ones
+        if len(self._heap) > 2 * self._live + 64:
+            self._heap = [e for e in self._heap if self._version.get(e[2]) == e[3]]
+            heapq.heapify(self._heap)
+            self._live = len(self._heap)
+
+    def pop_due(self, until):
+        # (date, kind, row) for every live event up to `until`, oldest first
+        due = []
+        while self._heap and self._heap[0][0] <= until:
+            date, _, key, version, kind = heapq.heappop(self._heap)
+            if self._version.get(key) != version:
+                continue
+            self._live -= 1
+            self._pending[key] -= 1
+            due.append((date, kind, self._rows[key]))
+            if not self._pending[key]:
+                self._invalidate(key)
+        return due
+
+# ---------- local JSON service ----------
+def split_terms(text):
+    return [part.strip().lower() for part in text.split(',') if part.strip()]
+
+def row_matches(row, season="", pairing="", kind=""):
+    if season and season.lower() not in split_terms(row.get("Season/s", "")):
+        return False
+    if pairing and pairing.lower() not in split_terms(row.get("Pairings", "")):
+        return False
+    if kind and kind.lower() != row.get("Type", "").strip().lower():
+        return False
+    return True
+
+class CatalogService:
+    # Read-only HTTP/JSON view of the rows the app has in memory. It runs an
+    # asyncio server on its own thread. The app publishes after every change,
+    # naming the record that changed, and only the cached responses that record
+    # could appear in are dropped; everything else keeps its body and ETag.
+    def __init__(self, host=SERVICE_HOST, port=SERVICE_PORT):
+        self.host = host
+        self.port = port
+        self._lock = threading.Lock()
+        self._rows = []
+        self._expand = lambda r: r
+        self._version = 0
+        self._snapshot = (0, ())  # version, rows frozen on first request after a change
+        self._cache = OrderedDict()
+        self._loop = None
+        self._thread = None
+
+    def publish(self, rows, expand, old=None, new=None):
+        # rows is the app's live list; it is only copied when a request needs it
+        with self._lock:
+            self._rows = rows
+            self._expand = expand
+            self._version += 1
+            if old is None and new is None:
+                self._cache.clear()
+            else:
+                changed = [r for r in (old, new) if r is not None]
+                for key in [k for k in self._cache if self._affected(k, changed)]:
+                    del self._cache[key]
+
+    def _affected(self, key, changed):
+        path, params = key
+        if path.startswith("/seeds/"):
+            name = unquote(path[len("/seeds/"):]).strip().lower()
+            return any(r.get("Name", "").strip().lower() == name for r in changed)
+        if path == "/query":
+            p = dict(params)
+            return any(row_matches(r, p.get("season", ""), p.get("pairing", ""), p.get("type", "")) for r in changed)
+        # listing pages shift with every add or delete
+        return path == "/seeds"
+
+    def start(self):
+        # bind here, on the caller's thread, so a busy port is reported to the caller
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        except OSError:
+            self._loop.close()
+            raise
+        self._thread = threading.Thread(target=self._run, name="catalog-service", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await reader.readline()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if not line or line in (b"\r\n", b"\n"):
+                    break
+                k, _, v = line.decode('latin-1').partition(':')
+                headers[k.strip().lower()] = v.strip()
+            parts = request.decode('latin-1').split()
+            if len(parts) < 2:
+                return
+            if parts[0] not in ("GET", "HEAD"):
+                status, etag, body = 405, None, json.dumps({"error": "read-only service"}).encode('utf-8')
+            else:
+                status, etag, body = self.respond(parts[1])
+            if etag is not None and headers.get("if-none-match") == etag:
+                status, body = 304, b""
+            reason = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}[status]
+            head = [f"HTTP/1.1 {status} {reason}", "Content-Type: application/json; charset=utf-8",
+                    f"Content-Length: {len(body)}", "Connection: close"]
+            if etag is not None:
+                head.append(f"ETag: {etag}")
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1'))
+            if parts[0] != "HEAD":
+                writer.write(body)
+            await writer.drain()
+        except (ConnectionError, UnicodeDecodeError):
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, target):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        params = {k: query[k][-1] for k in SERVICE_ROUTE_PARAMS.get(url.path, ()) if k in query}
+        key = (url.path, tuple(sorted(params.items())))
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                return entry
+            version, expand = self._version, self._expand
+            if self._snapshot[0] != version:
+                self._snapshot = (version, tuple(self._rows))
+            rows = self._snapshot[1]
+        status, payload = self._route(url.path, params, rows, expand)
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"' if status == 200 else None
+        entry = (status, etag, body)
+        if status != 200:
+            return entry
+        with self._lock:
+            # an edit that landed meanwhile may already make this answer stale
+            if self._version == version:
+                self._cache[key] = entry
+                while len(self._cache) > SERVICE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return entry
+
+    def _record(self, row, expand):
+        full = expand(row)
+        record = {col: full.get(col, "") for col in COLUMNS}
+        record["Site"] = site_label(row.get(SOURCE_KEY) or "")
+        return record
+
+    def _page(self, rows, params, expand):
+        try:
+            page = max(1, int(params.get("page", 1)))
+            per_page = min(SERVICE_MAX_PAGE_SIZE, max(1, int(params.get("per_page", SERVICE_PAGE_SIZE))))
+        except ValueError:
+            return 400, {"error": "page and per_page must be integers"}
+        start = (page - 1) * per_page
+        return 200, {"total": len(rows), "page": page, "per_page": per_page,
+                     "seeds": [self._record(r, expand) for r in rows[start:start + per_page]]}
+
+    def _route(self, path, params, rows, expand):
+        if path in ("/", ""):
+            return 200, {"endpoints": ["/seeds?page=&per_page=", "/seeds/<name>",
+                                       "/query?season=&pairing=&type=&page=&per_page="]}
+        if path == "/seeds":
+            return self._page(rows, params, expand)
+        if path.startswith("/seeds/"):
+            name = unquote(path[len("/seeds/"):]).strip().lower()
+            found = [self._record(r, expand) for r in rows if r.get("Name", "").strip().lower() == name]
+            if not found:
+                return 404, {"error": "no seed with that name"}
+            return 200, {"seeds": found}
+        if path == "/query":
+            matches = [r for r in rows if row_matches(r, params.get("season", ""), params.get("pairing", ""), params.get("type", ""))]
+            return self._page(matches, params, expand)
+        return 404, {"error": "unknown endpoint"}
+
+# ---------- catalog snapshots ----------
+class SnapshotStore:
+    # Content-addressed history for the catalogs in one directory. Rows are
+    # stored once by hash in an append-only pack; a version is a small tree of
+    # blocks over those hashes. Block boundaries depend on the hashes rather than
+    # on row positions, so an edit or insert only creates the few blocks around
+    # it and every other block is shared with earlier versions.
+    def __init__(self, directory):
+        self.root = os.path.join(directory, SNAPSHOT_DIR)
+        os.makedirs(self.root, exist_ok=True)
+        idx_path = os.path.join(self.root, "objects.idx")
+        self._index = {}
+        if os.path.exists(idx_path):
+            with open(idx_path, 'r', encoding='ascii') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 3:
+                        self._index[parts[0]] = (int(parts[1]), int(parts[2]))
+        self._pack = open(os.path.join(self.root, "objects.pack"), 'a+b')
+        self._idx = open(idx_path, 'a', encoding='ascii')
+        self._last = {}  # catalog -> (depth, nodes) of its newest version
+
+    def close(self):
+        self._pack.close()
+        self._idx.close()
+
+    # ----- objects -----
+    def _put(self, data):
+        h = hashlib.sha256(data).hexdigest()
+        if h not in self._index:
+            packed = zlib.compress(data)
+            offset = self._pack.seek(0, os.SEEK_END)
+            self._pack.write(packed)
+            self._pack.flush()
+            self._idx.write(f"{h} {offset} {len(packed)}\n")
+            self._idx.flush()
+            self._index[h] = (offset, len(packed))
+        return h
+
+    def _get(self, h):
+        offset, length = self._index[h]
+        self._pack.seek(offset)
+        return zlib.decompress(self._pack.read(length))
+
+    def _chunk(self, hashes):
+        nodes, group = [], []
+        for h in hashes:
+            group.append(h)
+            if int(h[:8], 16) % SNAPSHOT_FANOUT == 0:
+                nodes.append(self._put("\n".join(group).encode('ascii')))
+                group = []
+        if group:
+            nodes.append(self._put("\n".join(group).encode('ascii')))
+        return nodes
+
+    def _children(self, nodes):
+        return [h for n in nodes for h in self._get(n).decode('ascii').split("\n")]
+
+    # ----- versions -----
+    def _versions_dir(self, catalog):
+        return os.path.join(self.root, "versions", site_label(catalog))
+
+    def versions(self, catalog):
+        d = self._versions_dir(catalog)
+        if not os.path.isdir(d):
+            return []
+        return sorted(os.path.splitext(n)[0] for n in os.listdir(d) if n.endswith(".json"))
+
+    def manifest(self, catalog, version):
+        with open(os.path.join(self._versions_dir(catalog), version + ".json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def record(self, catalog, rows, expand=None):
+        # returns the new version id, or None when nothing changed since the last
+        # one. Only rows without a cached hash are serialized; expand(row) gives
+        # the full text of rows whose long fields live in a TextStore.
+        level = []
+        for r in rows:
+            owner, h = r.get(SNAPSHOT_HASH_KEY, (None, None))
+            if owner != id(r) or h not in self._index:
+                full = expand(r) if expand is not None else r
+                h = self._put(json.dumps([full.get(c, "") for c in COLUMNS], ensure_ascii=False,
+                                         separators=(',', ':')).encode('utf-8'))
+                r[SNAPSHOT_HASH_KEY] = (id(r), h)
+            level.append(h)
+        count, depth = len(level), 0
+        while len(level) > SNAPSHOT_FANOUT:
+            parents = self._chunk(level)
+            if len(parents) >= len(level):
+                break
+            level, depth = parents, depth + 1
+        if catalog not in self._last:
+            existing = self.versions(catalog)
+            if existing:
+                last = self.manifest(catalog, existing[-1])
+                if last["columns"] == COLUMNS:
+                    self._last[catalog] = (last["depth"], last["nodes"])
+        if self._last.get(catalog) == (depth, level):
+            return None
+        self._last[catalog] = (depth, level)
+        now = datetime.datetime.now()
+        version = now.strftime("%Y%m%dT%H%M%S%f")
+        d = self._versions_dir(catalog)
+        os.makedirs(d, exist_ok=True)
+        with open(os.path.join(d, version + ".json"), 'w', encoding='utf-8') as f:
+            json.dump({"time": now.isoformat(timespec='seconds'), "rows": count, "columns": COLUMNS,
+                       "depth": depth, "nodes": level}, f)
+        return version
+
+    def _decode(self, manifest, row_hash):
+        values = json.loads(self._get(row_hash).decode('utf-8'))
+        row = {col: "" for col in COLUMNS}
+        row.update((col, v) for col, v in zip(manifest["columns"], values) if col in row)
+        return row
+
+    def rows(self, catalog, version):
+        m = self.manifest(catalog, version)
+        nodes = m["nodes"]
+        for _ in range(m["depth"]):
+            nodes = self._children(nodes)
+        return [self._decode(m, h) for h in nodes]
+
+    def diff(self, catalog, old, new):
+        # walks both trees together and only opens blocks that differ
+        ma, mb = self.manifest(catalog, old), self.manifest(catalog, new)
+        a, da = Counter(ma["nodes"]), ma["depth"]
+        b, db = Counter(mb["nodes"]), mb["depth"]
+        while da > db:
+            a, da = Counter(self._children(a.elements())), da - 1
+        while db > da:
+            b, db = Counter(self._children(b.elements())), db - 1
+        while True:
+            a, b = a - b, b - a
+            if da == 0:
+                break
+            a, b, da = Counter(self._children(a.elements())), Counter(self._children(b.elements())), da - 1
+
+        # names can repeat, so rows that left and arrived are paired up per name
+        before, after = {}, {}
+        for h in a.elements():
+            r = self._decode(ma, h)
+            before.setdefault(r["Name"], []).append(r)
+        for h in b.elements():
+            r = self._decode(mb, h)
+            after.setdefault(r["Name"], []).append(r)
+        added, removed, changed = [], [], []
+        for name in before.keys() | after.keys():
+            olds, news = before.get(name, []), after.get(name, [])
+            for o, n in zip(olds, news):
+                changed.append((name, [c for c in COLUMNS if o[c] != n[c]]))
+            removed += [name] * (len(olds) - len(news))
+            added += [name] * (len(news) - len(olds))
+        return {"added": sorted(added, key=str.lower),
+                "removed": sorted(removed, key=str.lower),
+                "changed": sorted(changed, key=lambda nc: nc[0].lower())}
+
 class SeedManagerApp:
-    def __init__(self, root):
+    def __init__(self, root, catalog_files=None, service=None):
         self.root = root
+        self.service = service
         self.root.title("🌿 Seed Manager")
         # set a modern minimum and allow user to resize
         self.root.geometry("1400x820")
         self.root.minsize(1100, 700)
         self.root.configure(bg=COLORS['bg_dark'])
 
+        self.catalog_files = list(catalog_files or [CSV_FILE])
+        self.snapshot_stores = {}
         self.data = self.load_or_create_csv()
         self.filtered_data = self.data.copy()
+        self.stats_text = None
+        self.rebuild_indexes()
 
         self.setup_styles()
 
@@ -53,28 +1162,86 @@ class SeedManagerApp:
         self.multi_values = {}
         self.season_vars = {}
         self.selected_index = None
+        self.selected_source = None
+        self.name_choices = {}  # Edit dropdown entry -> (Name, catalog path or None)
+        self.tree_rows = {}
+        self.reference = None
+
+        # queries run on a worker; results tagged with an older generation are dropped
+        self.query_pool = ThreadPoolExecutor(max_workers=2)
+        self.query_results = queue.Queue()
+        self.query_gen = 0
+        self.query_future = None
+        self.query_pending = None  # (query, rows) whose result has not reached the table yet
+        self.query_polling = False
+        self.render_gen = 0
 
         self.setup_ui()
         self.refresh_table()
         self.update_name_dropdown()
+        self.scheduler_tick()
 
     # ---------- persistence ----------
     def load_or_create_csv(self):
-        if os.path.exists(CSV_FILE):
-            with open(CSV_FILE, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                return list(reader)
-        else:
-            with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=COLUMNS)
-                writer.writeheader()
-            return []
+        for path in self.catalog_files:
+            if not os.path.exists(path):
+                write_catalog(path, [])
+        self.text_store = TextStore()
+        data = [self.text_store.externalize(r) for r in load_catalogs(self.catalog_files)]
+        # capture the catalogs as loaded, so the first edit can be undone too;
+        # recording data that is already the newest version is a no-op
+        for path in self.catalog_files:
+            self.snapshot_store(path).record(path, (r for r in data if r.get(SOURCE_KEY) == path), self.text_store.expand)
+        return data
+
+    def save_to_csv(self, source=None):
+        # rewrites just `source` after a single edit, or every open catalog when None
+        paths = self.catalog_files if source is None else [source]
+        for path in paths:
+            rows = [r for r in self.data if r.get(SOURCE_KEY) == path]
+            write_catalog(path, self.full_rows(rows))
+            self.snapshot_store(path).record(path, rows, self.text_store.expand)
+
+    def snapshot_store(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        if directory not in self.snapshot_stores:
+            self.snapshot_stores[directory] = SnapshotStore(directory)
+        return self.snapshot_stores[directory]
+
+    def full_rows(self, rows):
+        return (self.text_store.expand(r) for r in rows)
+
+    def open_catalogs(self, paths=None):
+        if paths is None:
+            paths = filedialog.askopenfilenames(filetypes=[("CSV","*.csv")])
+        if not paths:
+            return
+        self.catalog_files = list(paths)
+        self.data = self.load_or_create_csv()
+        self.rebuild_indexes()
+        self.check_schedule(force_refresh=True)
+        self.tree.configure(show='tree headings' if len(self.catalog_files) > 1 else 'headings')
+        self.clear_form()
+        self.reset_filters()
+        self.update_name_dropdown()
 
-    def save_to_csv(self):
-        with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=COLUMNS)
-            writer.writeheader()
-            writer.writerows(self.data)
+    def rebuild_indexes(self):
+        self.pairing_graph = PairingGraph(self.data)
+        self.count_sown()
+        self.stats = CatalogStats(self.data)
+        self.refresh_stats_panel()
+        self.scheduler = PlantingScheduler(self.data)
+        self.notifications = {}
+        self.publish_catalog()
+
+    def publish_catalog(self, old=None, new=None):
+        if self.service is not None:
+            self.service.publish(self.data, self.text_store.expand, old, new)
+
+    def current_source(self):
+        if self.selected_source in self.catalog_files:
+            return self.selected_source
+        return self.catalog_files[0]
 
     # ---------- styles ----------
     def setup_styles(self):
@@ -178,6 +1345,10 @@ class SeedManagerApp:
         btn_quick_add.pack(fill='x', pady=(0,8))
         btn_export = self.create_modern_button(sb_actions, "💾 Export CSV", self.export_csv, bg_color=COLORS['bg_dark'])
         btn_export.pack(fill='x', pady=(0,8))
+        btn_open = self.create_modern_button(sb_actions, "📂 Open Catalogs", self.open_catalogs, bg_color=COLORS['bg_dark'])
+        btn_open.pack(fill='x', pady=(0,8))
+        btn_ref = self.create_modern_button(sb_actions, "📚 Reference", self.open_reference_catalog, bg_color=COLORS['bg_dark'])
+        btn_ref.pack(fill='x', pady=(0,8))
 
         # small hint
         hint = tk.Label(sidebar, text="Tip: double-click rows to edit or view long text", bg=COLORS['bg_light'], fg=COLORS['text_dim'], wraplength=180, font=('Segoe UI', 9))
@@ -210,6 +1381,18 @@ class SeedManagerApp:
         reset_btn = self.create_modern_button(search_frame, "⟲ Reset Filters", self.reset_filters, bg_color=COLORS['bg_dark'])
         reset_btn.pack(padx=8, pady=(6,12), fill='x')
 
+        # upcoming transplant / harvest reminders
+        due_frame = tk.LabelFrame(sidebar, text="Due Soon", bg=COLORS['bg_light'], fg=COLORS['text'], font=('Segoe UI', 10, 'bold'))
+        due_frame.pack(side='bottom', fill='both', expand=True, padx=12, pady=(0,12))
+        self.due_list = tk.Listbox(due_frame, height=6, bg=COLORS['input_bg'], fg=COLORS['text'],
+                                   selectbackground=COLORS['accent'], selectforeground=COLORS['bg_dark'],
+                                   relief='flat', borderwidth=0, font=('Segoe UI', 9))
+        self.due_list.pack(fill='both', expand=True, padx=8, pady=(6,4))
+        self.due_list.bind("<Double-1>", self.on_due_double_click)
+        self.due_keys = []
+        dismiss_btn = self.create_modern_button(due_frame, "✓ Dismiss", self.dismiss_notification, bg_color=COLORS['bg_dark'])
+        dismiss_btn.pack(padx=8, pady=(0,8), fill='x')
+
 
 
 
@@ -245,13 +1428,23 @@ class SeedManagerApp:
         save_btn.pack(side='left', padx=6)
         save_as_btn = self.create_modern_button(toolbar, "Save As", self.save_as, bg_color=COLORS['bg_light'])
         save_as_btn.pack(side='left', padx=6)
+        beds_btn = self.create_modern_button(toolbar, "🌱 Beds", self.open_bed_planner, bg_color=COLORS['bg_light'])
+        beds_btn.pack(side='left', padx=6)
+        stats_btn = self.create_modern_button(toolbar, "📊 Stats", self.open_stats_panel, bg_color=COLORS['bg_light'])
+        stats_btn.pack(side='left', padx=6)
+        history_btn = self.create_modern_button(toolbar, "🕘 History", self.open_history, bg_color=COLORS['bg_light'])
+        history_btn.pack(side='left', padx=6)
 
         # Table container
         table_container = tk.Frame(main_area, bg=COLORS['border'])
         table_container.pack(fill='both', expand=True)
 
         # Treeview
-        self.tree = ttk.Treeview(table_container, columns=COLUMNS, show='headings', selectmode='browse')
+        # the tree column (#0) shows which site catalog a row came from when several are open
+        show = 'tree headings' if len(self.catalog_files) > 1 else 'headings'
+        self.tree = ttk.Treeview(table_container, columns=COLUMNS, show=show, selectmode='browse')
+        self.tree.heading('#0', text="Site")
+        self.tree.column('#0', width=120, minwidth=80, stretch=False)
         # add striped row tags
         self.tree.tag_configure('oddrow', background=COLORS['bg_medium'])
         self.tree.tag_configure('evenrow', background='#0d1516')  # slightly darker
@@ -431,9 +1624,20 @@ class SeedManagerApp:
 
     # ---------- UI helpers ----------
     def update_name_dropdown(self):
-        names = [r.get("Name", "") for r in self.data if r.get("Name", "")]
-        names_unique = sorted(list(dict.fromkeys(names)))
-        self.name_dropdown['values'] = names_unique
+        # a name found in several open catalogs gets one "Name (site)" entry per catalog
+        sites = {}
+        for r in self.data:
+            name = r.get("Name", "")
+            if name:
+                sites.setdefault(name, {}).setdefault(r.get(SOURCE_KEY))
+        self.name_choices = {}
+        for name, paths in sites.items():
+            if len(paths) == 1:
+                self.name_choices[name] = (name, None)
+            else:
+                for path in paths:
+                    self.name_choices[f"{name} ({site_label(path or '')})"] = (name, path)
+        self.name_dropdown['values'] = sorted(self.name_choices)
 
         pairing_items = set()
         for r in self.data:
@@ -464,23 +1668,80 @@ class SeedManagerApp:
     def live_search(self):
         q = self.search_var.get().strip().lower()
         if not q:
-            self.filtered_data = self.data.copy()
+            self.run_query(lambda rows, cancelled: list(rows))
         else:
-            self.filtered_data = [r for r in self.data if q in r.get("Name", "").lower()]
-        self.refresh_table()
+            self.run_query(lambda rows, cancelled: filter_rows(rows, lambda r: q in r.get("Name", "").lower(), cancelled))
+
+    # ---------- background queries ----------
+    def run_query(self, query, rows=None):
+        # query(rows, cancelled) runs on a worker thread against a snapshot of the rows
+        self.query_gen += 1
+        gen = self.query_gen
+        if self.query_future is not None:
+            self.query_future.cancel()
+        snapshot = tuple(self.data if rows is None else rows)
+        cancelled = lambda: gen != self.query_gen
+
+        def work():
+            result = query(snapshot, cancelled)
+            if result is not None and not cancelled():
+                self.query_results.put((gen, result))
+
+        self.query_future = self.query_pool.submit(work)
+        self.query_pending = (query, snapshot)
+        if not self.query_polling:
+            self.query_polling = True
+            self.root.after(QUERY_POLL_MS, self.poll_queries)
+
+    def cancel_queries(self):
+        self.query_gen += 1
+        self.query_pending = None
+        if self.query_future is not None:
+            self.query_future.cancel()
+
+    def poll_queries(self):
+        latest = None
+        while True:
+            try:
+                gen, result = self.query_results.get_nowait()
+            except queue.Empty:
+                break
+            if gen == self.query_gen:
+                latest = result
+        if latest is not None:
+            self.filtered_data = latest
+            self.query_pending = None
+            self.refresh_table()
+        if self.query_future is not None and not self.query_future.done():
+            self.root.after(QUERY_POLL_MS, self.poll_queries)
+        elif not self.query_results.empty():
+            self.root.after(QUERY_POLL_MS, self.poll_queries)
+        else:
+            self.query_polling = False
 
     # ---------- filters & sorts ----------
     def sort_by_name(self):
-        self.filtered_data = sorted(self.filtered_data, key=lambda r: r.get("Name", "").lower())
-        self.refresh_table()
+        self.sort_current(lambda r: r.get("Name", "").lower())
 
     def sort_by_type(self):
-        self.filtered_data = sorted(self.filtered_data, key=lambda r: r.get("Type", "").lower())
-        self.refresh_table()
+        self.sort_current(lambda r: r.get("Type", "").lower())
+
+    def sort_current(self, key):
+        # a search or filter that is still running would be superseded by the sort,
+        # so run it again in the same job and sort what it finds
+        if self.query_pending is None:
+            self.run_query(lambda rows, cancelled: sort_rows(rows, key, cancelled), self.filtered_data)
+            return
+        query, snapshot = self.query_pending
+
+        def chained(rows, cancelled):
+            found = query(rows, cancelled)
+            return None if found is None else sort_rows(found, key, cancelled)
+
+        self.run_query(chained, snapshot)
 
     def filter_heirloom(self):
-        self.filtered_data = [r for r in self.data if r.get("Heirloom (Y/N)", "").lower() in ("y", "yes")]
-        self.refresh_table()
+        self.run_query(lambda rows, cancelled: filter_rows(rows, lambda r: r.get("Heirloom (Y/N)", "").lower() in ("y", "yes"), cancelled))
 
     def filter_pairing(self):
         val = self.pairing_var.get().strip().lower()
@@ -492,8 +1753,7 @@ class SeedManagerApp:
                 return False
             parts = [part.strip().lower() for part in p.split(',') if part.strip()]
             return val in parts
-        self.filtered_data = [r for r in self.data if row_has_pairing(r)]
-        self.refresh_table()
+        self.run_query(lambda rows, cancelled: filter_rows(rows, row_has_pairing, cancelled))
 
     def filter_season(self):
         val = self.season_filter_var.get().strip()
@@ -517,32 +1777,47 @@ class SeedManagerApp:
         # If you want to combine filters, you'd need to modify `live_search` and `filter_pairing` to also call a single `apply_filters` method.
         # For a simple, separate filter like the current implementation, this is fine.
         
-        self.filtered_data = [r for r in self.data if row_has_season(r, val)]
-        self.refresh_table()
+        self.run_query(lambda rows, cancelled: filter_rows(rows, lambda r: row_has_season(r, val), cancelled))
 
     def reset_filters(self):
         self.pairing_var.set('')
         self.season_filter_var.set('All Seasons') # Set the filter variable to the new default
         self.search_var.set('')
+        # clearing the search box queued a live search; this reset supersedes it
+        self.cancel_queries()
         self.filtered_data = self.data.copy()
         self.refresh_table()
         
     # ---------- table/form linking ----------
     def refresh_table(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        for idx, r in enumerate(self.filtered_data):
-            values = [r.get(col, "") for col in COLUMNS]
+        self.render_gen += 1
+        self.tree.delete(*self.tree.get_children())
+        self.tree_rows = {}
+        # filtered_data is always replaced, never edited in place, so batches can
+        # keep reading it; the dropdowns follow data changes, not every result
+        self.insert_table_batch(self.render_gen, self.filtered_data, 0)
+
+    def insert_table_batch(self, gen, rows, start):
+        # fill the table a slice at a time so Tk keeps handling input in between
+        if gen != self.render_gen:
+            return
+        end = min(start + TABLE_BATCH, len(rows))
+        for idx in range(start, end):
+            r = rows[idx]
+            values = [preview(r.get(col, "")) if col in LONG_TEXT_COLUMNS else r.get(col, "") for col in COLUMNS]
             tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-            self.tree.insert('', 'end', values=values, tags=(tag,))
-        self.update_name_dropdown()
+            iid = self.tree.insert('', 'end', text=site_label(r.get(SOURCE_KEY, "")), values=values, tags=(tag,))
+            self.tree_rows[iid] = r
+        if end < len(rows):
+            self.root.after(1, self.insert_table_batch, gen, rows, end)
 
     def on_name_select(self, event=None):
-        name = self.name_var.get()
-        if not name:
+        choice = self.name_var.get()
+        if not choice:
             return
+        name, source = self.name_choices.get(choice, (choice, None))
         for idx, row in enumerate(self.data):
-            if row.get("Name", "") == name:
+            if row.get("Name", "") == name and (source is None or row.get(SOURCE_KEY) == source):
                 self.selected_index = idx
                 self.load_row_into_form(row)
                 break
@@ -559,18 +1834,16 @@ class SeedManagerApp:
 
         if col_index is not None and 0 <= col_index < len(COLUMNS):
             col_name = COLUMNS[col_index]
-            values = self.tree.item(row_id, 'values')
-            cell_value = ""
-            if col_index < len(values):
-                cell_value = values[col_index] or ""
-            if col_name in LONG_TEXT_COLUMNS:
-                self.open_text_popup(col_name, cell_value)
+            row = self.tree_rows.get(row_id)
+            if col_name in LONG_TEXT_COLUMNS and row is not None:
+                self.open_text_popup(col_name, row)
                 return
 
         self.tree.selection_set(row_id)
         self.load_selected_to_form()
 
-    def open_text_popup(self, title, text):
+    def open_text_popup(self, title, row):
+        text = self.text_store.fetch(row, title)
         popup = tk.Toplevel(self.root)
         popup.title(title)
         popup.configure(bg=COLORS['bg_dark'])
@@ -593,24 +1866,20 @@ class SeedManagerApp:
         sel = self.tree.selection()
         if not sel:
             return
-        vals = self.tree.item(sel[0], 'values')
-        row = {}
-        for i, col in enumerate(COLUMNS):
-            if i < len(vals):
-                row[col] = vals[i]
-            else:
-                row[col] = ""
-        name = row.get("Name", "")
+        row = self.tree_rows.get(sel[0])
+        if row is None:
+            return
         for idx, r in enumerate(self.data):
-            if r.get("Name", "") == name:
+            if r is row:
                 self.selected_index = idx
                 break
         self.load_row_into_form(row)
 
     def load_row_into_form(self, row):
         self.clear_form()
+        self.selected_source = row.get(SOURCE_KEY)
         for col in COLUMNS:
-            val = row.get(col, "")
+            val = self.text_store.fetch(row, col)
             widget = self.entries.get(col)
             if col in ("Comments", "Benefits", "Uses", "Issues"):
                 if widget:
@@ -672,6 +1941,22 @@ class SeedManagerApp:
             self.name_var.set(row.get("Name"))
 
     # ---------- add / update / delete ----------
+    def on_record_changed(self, old, new):
+        # keep derived indexes in step with a single added / edited / deleted record
+        self.pairing_graph.update(old, new)
+        for row, step in ((old, -1), (new, 1)):
+            if row is not None and row.get("Name") and sown_in(row, self.sown_year):
+                self.sown[row["Name"]] += step
+        self.stats.update(old, new)
+        self.refresh_stats_panel()
+        self.scheduler.update(old, new)
+        if old is not None:
+            key = record_key(old)
+            for nkey in [k for k in self.notifications if k[0] == key]:
+                del self.notifications[nkey]
+        self.check_schedule(force_refresh=old is not None)
+        self.publish_catalog(old, new)
+
     def add_or_update_entry(self):
         new = {}
         for col in COLUMNS:
@@ -720,16 +2005,19 @@ class SeedManagerApp:
             messagebox.showwarning("Validation", "Name is required.")
             return
 
-        found = False
+        new[SOURCE_KEY] = self.current_source()
+        self.text_store.externalize(new)
+        old = None
         for i, row in enumerate(self.data):
-            if row.get("Name", "") == new["Name"]:
+            if row.get("Name", "") == new["Name"] and row.get(SOURCE_KEY) == new[SOURCE_KEY]:
+                old = row
                 self.data[i] = new
-                found = True
                 break
-        if not found:
+        if old is None:
             self.data.append(new)
+        self.on_record_changed(old, new)
 
-        self.save_to_csv()
+        self.save_to_csv(new[SOURCE_KEY])
         self.reset_filters()
         self.refresh_table()
         self.update_name_dropdown()
@@ -741,10 +2029,14 @@ class SeedManagerApp:
         if not sel:
             messagebox.showwarning("Select", "Select a row to delete.")
             return
-        name = self.tree.item(sel[0], 'values')[0]
+        row = self.tree_rows.get(sel[0])
+        if row is None:
+            return
+        name = row.get("Name", "")
         if messagebox.askyesno("Confirm", f"Delete '{name}'?"):
-            self.data = [r for r in self.data if r.get("Name", "") != name]
-            self.save_to_csv()
+            self.data = [r for r in self.data if r is not row]
+            self.on_record_changed(row, None)
+            self.save_to_csv(row.get(SOURCE_KEY))
             self.reset_filters()
             self.refresh_table()
             self.update_name_dropdown()
@@ -798,30 +2090,351 @@ class SeedManagerApp:
             messagebox.showwarning("Validation", "Name is required to save.")
             return
 
-        found = False
+        new[SOURCE_KEY] = self.current_source()
+        self.text_store.externalize(new)
+        old = None
         for i, row in enumerate(self.data):
-            if row.get("Name", "") == new["Name"]:
+            if row.get("Name", "") == new["Name"] and row.get(SOURCE_KEY) == new[SOURCE_KEY]:
+                old = row
                 self.data[i] = new
-                found = True
                 break
-        if not found:
+        if old is None:
             self.data.append(new)
+        self.on_record_changed(old, new)
 
-        self.save_to_csv()
+        self.save_to_csv(new[SOURCE_KEY])
         self.reset_filters()
         self.refresh_table()
         self.update_name_dropdown()
         messagebox.showinfo("Saved", f"Saved '{new['Name']}'")
 
+    # ---------- companion planting ----------
+    def count_sown(self):
+        self.sown_year = datetime.date.today().year
+        self.sown = Counter(r["Name"] for r in self.data if r.get("Name") and sown_in(r, self.sown_year))
+
+    def sown_this_season(self):
+        # kept in step by on_record_changed; only recounted when the year rolls over
+        if self.sown_year != datetime.date.today().year:
+            self.count_sown()
+        return sorted((n for n, c in self.sown.items() if c > 0), key=str.lower)
+
+    def run_in_background(self, work, done):
+        # run work() on the query pool and hand its result to done() on the Tk thread
+        future = self.query_pool.submit(work)
+        def check():
+            if future.done():
+                done(future.result())
+            else:
+                self.root.after(QUERY_POLL_MS, check)
+        self.root.after(QUERY_POLL_MS, check)
+
+    def open_bed_planner(self):
+        popup = tk.Toplevel(self.root)
+        popup.title("Bed Planner")
+        popup.configure(bg=COLORS['bg_dark'])
+        popup.geometry("700x460")
+        popup.transient(self.root)
+
+        lbl = tk.Label(popup, text="Companion Planting", bg=COLORS['bg_dark'], fg=COLORS['accent'], font=('Segoe UI', 11, 'bold'))
+        lbl.pack(anchor='w', padx=12, pady=(12,6))
+
+        controls = tk.Frame(popup, bg=COLORS['bg_dark'])
+        controls.pack(fill='x', padx=12, pady=(0,8))
+
+        txt = tk.Text(popup, wrap='word', bg=COLORS['bg_medium'], fg=COLORS['text'], insertbackground=COLORS['accent'])
+        txt.pack(fill='both', expand=True, padx=12, pady=(0,12))
+
+        def show(lines):
+            txt.configure(state='normal')
+            txt.delete('1.0', tk.END)
+            txt.insert('1.0', "\n".join(lines) if lines else "No compatible seeds found.")
+            txt.configure(state='disabled')
+
+        def bed_for_current():
+            name = self.name_var.get()
+            if not name or name not in self.pairing_graph:
+                show(["Pick a seed in the Edit dropdown first."])
+                return
+            bed = self.pairing_graph.bed_for([name])
+            show([f"Bed for {name}:"] + [f"  • {n}" for n in bed])
+
+        tk.Label(controls, text="Beds:", bg=COLORS['bg_dark'], fg=COLORS['text_dim']).pack(side='left', padx=(0,4))
+        beds_var = tk.StringVar(value="3")
+        ttk.Combobox(controls, textvariable=beds_var, values=[str(i) for i in range(1, 21)], width=4).pack(side='left', padx=(0,8))
+
+        def suggest():
+            try:
+                count = max(1, int(beds_var.get()))
+            except ValueError:
+                count = 3
+            graph = self.pairing_graph.snapshot()
+            def done(beds):
+                if txt.winfo_exists():
+                    show([f"Bed {i}: " + ", ".join(bed) for i, bed in enumerate(beds, start=1)])
+            show(["Working out beds…"])
+            self.run_in_background(lambda: graph.suggest_beds(count), done)
+
+        def season_partners():
+            sown = self.sown_this_season()
+            if not sown:
+                show(["Nothing has a Seed Started Date this year yet."])
+                return
+            common = self.pairing_graph.compatible_with_all(sown)
+            show([f"Pairs with everything sown this season ({', '.join(sown)}):"] + [f"  • {n}" for n in common])
+
+        self.create_modern_button(controls, "Suggest Beds", suggest, bg_color=COLORS['accent']).pack(side='left', padx=(0,8))
+        self.create_modern_button(controls, "Bed for Selected", bed_for_current).pack(side='left', padx=(0,8))
+        self.create_modern_button(controls, "This Season", season_partners).pack(side='left', padx=(0,8))
+
+        bed_for_current()
+
+    # ---------- reference catalog ----------
+    def open_reference_catalog(self):
+        path = REFERENCE_FILE if os.path.exists(REFERENCE_FILE) else None
+        if path is None:
+            path = filedialog.askopenfilename(filetypes=[("Compiled catalog","*.seedcat")])
+        if not path:
+            return
+        if self.reference is None or self.reference.path != path:
+            try:
+                reference = BinaryCatalog(path)
+            except (OSError, ValueError) as e:
+                messagebox.showerror("Reference", str(e))
+                return
+            if self.reference is not None:
+                self.reference.close()
+            self.reference = reference
+        ref = self.reference
+
+        popup = tk.Toplevel(self.root)
+        popup.title(f"Reference — {site_label(path)}")
+        popup.configure(bg=COLORS['bg_dark'])
+        popup.geometry("820x480")
+        popup.transient(self.root)
+
+        lbl = tk.Label(popup, text=f"{len(ref)} reference varieties", bg=COLORS['bg_dark'], fg=COLORS['accent'], font=('Segoe UI', 11, 'bold'))
+        lbl.pack(anchor='w', padx=12, pady=(12,6))
+
+        search_var = tk.StringVar()
+        search_entry = self.create_entry(popup, width=40)
+        search_entry.configure(textvariable=search_var)
+        search_entry.pack(anchor='w', padx=12, pady=(0,8))
+
+        body = tk.Frame(popup, bg=COLORS['bg_dark'])
+        body.pack(fill='both', expand=True, padx=12)
+        names_list = tk.Listbox(body, width=32, bg=COLORS['input_bg'], fg=COLORS['text'],
+                                selectbackground=COLORS['accent'], selectforeground=COLORS['bg_dark'], relief='flat')
+        names_list.pack(side='left', fill='y')
+        detail = tk.Text(body, wrap='word', bg=COLORS['bg_medium'], fg=COLORS['text'], insertbackground=COLORS['accent'])
+        detail.pack(side='left', fill='both', expand=True, padx=(8,0))
+
+        current = {}
+
+        def refill(*a):
+            names_list.delete(0, tk.END)
+            for name in ref.names(search_var.get(), limit=REFERENCE_LIST_LIMIT):
+                names_list.insert(tk.END, name)
+
+        def show(event=None):
+            sel = names_list.curselection()
+            if not sel:
+                return
+            try:
+                row = ref.find(names_list.get(sel[0]))
+            except ValueError as e:
+                messagebox.showerror("Reference", str(e), parent=popup)
+                return
+            if row is None:
+                return
+            current['row'] = row
+            detail.configure(state='normal')
+            detail.delete('1.0', tk.END)
+            detail.insert('1.0', "\n".join(f"{col}: {row[col]}" for col in COLUMNS if row.get(col)))
+            detail.configure(state='disabled')
+
+        def copy_to_form():
+            if 'row' in current:
+                self.load_row_into_form(current['row'])
+
+        search_var.trace_add("write", refill)
+        names_list.bind("<<ListboxSelect>>", show)
+        btn = self.create_modern_button(popup, "Copy to Form", copy_to_form, bg_color=COLORS['accent'])
+        btn.pack(pady=(8,12))
+        refill()
+
+    # ---------- planting schedule ----------
+    def scheduler_tick(self):
+        self.check_schedule()
+        self.root.after(SCHEDULE_TICK_MS, self.scheduler_tick)
+
+    def check_schedule(self, force_refresh=False):
+        today = datetime.date.today()
+        self.scheduler.today = today
+        due = self.scheduler.pop_due(today + datetime.timedelta(days=SCHEDULE_LOOKAHEAD_DAYS))
+        for date, kind, row in due:
+            self.notifications[(record_key(row), kind)] = (date, row)
+        if due or force_refresh:
+            self.refresh_notifications()
+
+    def refresh_notifications(self):
+        today = datetime.date.today()
+        self.due_list.delete(0, tk.END)
+        self.due_keys = sorted(self.notifications,
+                               key=lambda k: (self.notifications[k][0], k[1], self.notifications[k][1].get("Name", "").lower()))
+        for key in self.due_keys:
+            date, row = self.notifications[key]
+            if date < today:
+                when = f"overdue {date:%m/%d}"
+            elif date == today:
+                when = "today"
+            else:
+                when = f"by {date:%m/%d}"
+            self.due_list.insert(tk.END, f"{key[1]} {row.get('Name', '')} — {when}")
+
+    def dismiss_notification(self):
+        sel = self.due_list.curselection()
+        if not sel:
+            return
+        self.notifications.pop(self.due_keys[sel[0]], None)
+        self.refresh_notifications()
+
+    def on_due_double_click(self, event=None):
+        sel = self.due_list.curselection()
+        if not sel:
+            return
+        target = self.notifications[self.due_keys[sel[0]]][1]
+        for idx, row in enumerate(self.data):
+            if row is target:
+                self.selected_index = idx
+                self.load_row_into_form(row)
+                break
+
+    # ---------- statistics ----------
+    def open_stats_panel(self):
+        if self.stats_text is not None and self.stats_text.winfo_exists():
+            self.stats_text.winfo_toplevel().lift()
+            return
+        popup = tk.Toplevel(self.root)
+        popup.title("Catalog Stats")
+        popup.configure(bg=COLORS['bg_dark'])
+        popup.geometry("420x560")
+        popup.transient(self.root)
+
+        lbl = tk.Label(popup, text="Catalog Stats", bg=COLORS['bg_dark'], fg=COLORS['accent'], font=('Segoe UI', 11, 'bold'))
+        lbl.pack(anchor='w', padx=12, pady=(12,6))
+
+        self.stats_text = tk.Text(popup, wrap='word', bg=COLORS['bg_medium'], fg=COLORS['text'], insertbackground=COLORS['accent'])
+        self.stats_text.pack(fill='both', expand=True, padx=12, pady=(0,12))
+        self.refresh_stats_panel()
+
+    def refresh_stats_panel(self):
+        if self.stats_text is None or not self.stats_text.winfo_exists():
+            return
+        self.stats_text.configure(state='normal')
+        self.stats_text.delete('1.0', tk.END)
+        self.stats_text.insert('1.0', "\n".join(self.stats.summary_lines()))
+        self.stats_text.configure(state='disabled')
+
+    # ---------- history ----------
+    def open_history(self):
+        popup = tk.Toplevel(self.root)
+        popup.title("Catalog History")
+        popup.configure(bg=COLORS['bg_dark'])
+        popup.geometry("760x480")
+        popup.transient(self.root)
+
+        top_row = tk.Frame(popup, bg=COLORS['bg_dark'])
+        top_row.pack(fill='x', padx=12, pady=(12,6))
+        tk.Label(top_row, text="Catalog:", bg=COLORS['bg_dark'], fg=COLORS['text_dim']).pack(side='left', padx=(0,4))
+        catalog_var = tk.StringVar(value=self.catalog_files[0])
+        catalog_dd = ttk.Combobox(top_row, textvariable=catalog_var, values=self.catalog_files, width=48, state='readonly')
+        catalog_dd.pack(side='left')
+
+        body = tk.Frame(popup, bg=COLORS['bg_dark'])
+        body.pack(fill='both', expand=True, padx=12)
+        versions_list = tk.Listbox(body, width=30, selectmode='extended', bg=COLORS['input_bg'], fg=COLORS['text'],
+                                   selectbackground=COLORS['accent'], selectforeground=COLORS['bg_dark'], relief='flat')
+        versions_list.pack(side='left', fill='y')
+        out = tk.Text(body, wrap='word', bg=COLORS['bg_medium'], fg=COLORS['text'], insertbackground=COLORS['accent'])
+        out.pack(side='left', fill='both', expand=True, padx=(8,0))
+
+        versions = []
+
+        def show(lines):
+            out.configure(state='normal')
+            out.delete('1.0', tk.END)
+            out.insert('1.0', "\n".join(lines))
+            out.configure(state='disabled')
+
+        def reload(*a):
+            path = catalog_var.get()
+            store = self.snapshot_store(path)
+            versions[:] = store.versions(path)
+            versions_list.delete(0, tk.END)
+            for v in reversed(versions):
+                m = store.manifest(path, v)
+                versions_list.insert(tk.END, f"{m['time'].replace('T', ' ')}  ({m['rows']} rows)")
+            show([f"{len(versions)} saved versions." if versions else "No versions saved yet."])
+
+        def selected():
+            return [versions[len(versions) - 1 - i] for i in versions_list.curselection()]
+
+        def diff():
+            sel = selected()
+            if not sel:
+                return
+            if len(sel) == 1:
+                sel.append(versions[-1])
+            old, new = min(sel), max(sel)
+            if old == new:
+                show(["Pick an older version (or two versions) to compare with."])
+                return
+            path = catalog_var.get()
+            d = self.snapshot_store(path).diff(path, old, new)
+            lines = [f"Added ({len(d['added'])}):"] + [f"  + {n}" for n in d['added']]
+            lines += [f"Removed ({len(d['removed'])}):"] + [f"  - {n}" for n in d['removed']]
+            lines += [f"Changed ({len(d['changed'])}):"] + [f"  ~ {n}: {', '.join(cols)}" for n, cols in d['changed']]
+            show(lines)
+
+        def restore():
+            sel = selected()
+            if len(sel) != 1:
+                messagebox.showwarning("Restore", "Select one version to restore.", parent=popup)
+                return
+            path = catalog_var.get()
+            if not messagebox.askyesno("Restore", f"Replace {site_label(path)} with the selected version?", parent=popup):
+                return
+            self.restore_version(path, sel[0])
+            reload()
+
+        catalog_dd.bind("<<ComboboxSelected>>", reload)
+        actions = tk.Frame(popup, bg=COLORS['bg_dark'])
+        actions.pack(pady=(8,12))
+        self.create_modern_button(actions, "Diff", diff, bg_color=COLORS['bg_light']).pack(side='left', padx=6)
+        self.create_modern_button(actions, "Restore", restore, bg_color=COLORS['warn']).pack(side='left', padx=6)
+        reload()
+
+    def restore_version(self, path, version):
+        restored = self.snapshot_store(path).rows(path, version)
+        for r in restored:
+            r[SOURCE_KEY] = path
+            self.text_store.externalize(r)
+        self.data = [r for r in self.data if r.get(SOURCE_KEY) != path] + restored
+        # saving records the restore as the newest version, so it can be undone too
+        self.save_to_csv(path)
+        self.rebuild_indexes()
+        self.check_schedule(force_refresh=True)
+        self.clear_form()
+        self.reset_filters()
+        self.update_name_dropdown()
+
     # ---------- export ----------
     def export_csv(self):
         f = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV","*.csv")])
         if not f:
             return
-        with open(f, 'w', newline='', encoding='utf-8') as fh:
-            writer = csv.DictWriter(fh, fieldnames=COLUMNS)
-            writer.writeheader()
-            writer.writerows(self.data)
+        write_catalog(f, self.full_rows(self.data))
         messagebox.showinfo("Exported", f"Exported to {f}")
 
     # ---------- save as ----------
@@ -829,10 +2442,7 @@ class SeedManagerApp:
         f = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV","*.csv")])
         if not f:
             return
-        with open(f, 'w', newline='', encoding='utf-8') as fh:
-            writer = csv.DictWriter(fh, fieldnames=COLUMNS)
-            writer.writeheader()
-            writer.writerows(self.data)
+        write_catalog(f, self.full_rows(self.data))
         messagebox.showinfo("Saved", f"Saved to {f}")
 
     # ---------- helpers ----------
@@ -853,12 +2463,34 @@ class SeedManagerApp:
         for sv in self.season_vars.values():
             sv.set(False)
         self.selected_index = None
+        self.selected_source = None
         self.name_var.set('')
 
 # ---------- main ----------
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed Manager")
+    parser.add_argument("catalogs", nargs='*', help=f"catalog CSV files to open (default: {CSV_FILE})")
+    parser.add_argument("--compile", nargs=2, metavar=("CSV", "OUT"),
+                        help="compile a CSV catalog into a read-only binary reference catalog and exit")
+    parser.add_argument("--serve", nargs='?', type=int, const=SERVICE_PORT, metavar="PORT",
+                        help=f"also serve the catalog as read-only JSON on {SERVICE_HOST} (default port {SERVICE_PORT})")
+    args = parser.parse_args(argv)
+
+    if args.compile:
+        count = compile_catalog(*args.compile)
+        print(f"Compiled {count} rows into {args.compile[1]}")
+        return
+
+    service = None
+    if args.serve:
+        service = CatalogService(port=args.serve)
+        try:
+            service.start()
+        except OSError as e:
+            parser.exit(1, f"Could not start the catalog service on {SERVICE_HOST}:{args.serve}: {e}\n")
+
     root = tk.Tk()
-    app = SeedManagerApp(root)
+    app = SeedManagerApp(root, catalog_files=args.catalogs, service=service)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+from seed_manager import COLUMNS
+
+
+def seed(name, **fields):
+    row = {col: "" for col in COLUMNS}
+    row["Name"] = name
+    row.update(fields)
+    return row
+
+
+def sample_rows():
+    return [
+        seed("Tomato", Type="Nightshade", Pairings="Basil, Carrots", **{
+            "Life Cycle": "Annual", "Season/s": "Summer", "Heirloom (Y/N)": "Y",
+            "Germination (days)": "6-12", "Time to Maturity": "70-80",
+            "Seed Started Date": "03/01/2026", "Transplant Timeframe (weeks)": "6"}),
+        seed("Basil", Type="Herb", Pairings="Tomatoes, Peppers", **{
+            "Life Cycle": "Annual", "Season/s": "Summer, Fall", "Heirloom (Y/N)": "n",
+            "Germination (days)": "5-10", "Time to Maturity": "60",
+            "Seed Started Date": "03/15/2026"}),
+        seed("Carrot", Type="Root", Pairings="Tomato, Onion", **{
+            "Season/s": "Spring", "Germination (days)": "14-21", "Time to Maturity": "70",
+            "Seed Started Date": "02/20/2026", "Transplant Date": "04/10/2026"}),
+        seed("Pepper", Type="Nightshade", Pairings="Basil", **{
+            "Season/s": "Summer", "Germination (days)": "8-14", "Time to Maturity": "90",
+            "Seed Started Date": "02/01/2026", "Transplant Timeframe (weeks)": "8"}),
+        seed("Onion", Type="Allium", Pairings="Carrot", **{
+            "Season/s": "Spring", "Harvest Date": "07/01/2026"}),
+        seed("Basil", Type="Herb", Comments="second packet", **{"Seed Started Date": "01/05/2025"}),
+    ]
+
+
+def edit_sequence(rows):
+    # (old, new) pairs the app would hand to on_record_changed
+    edited = dict(rows[1], Pairings="Tomato", **{"Time to Maturity": "45-50"})
+    added = seed("Marigold", Type="Flower", Pairings="Tomato, Pepper, Basil", **{
+        "Season/s": "Summer", "Germination (days)": "4-8",
+        "Seed Started Date": "03/20/2026", "Transplant Timeframe (weeks)": "4",
+        "Time to Maturity": "50"})
+    renamed = dict(rows[4], Name="Leek", Type="Allium", **{"Harvest Date": ""})
+    return [(rows[1], edited), (None, added), (rows[3], None), (rows[4], renamed)]
+
+
+def apply_edits(rows, edits):
+    current = list(rows)
+    for old, new in edits:
+        if old is not None:
+            current = [r for r in current if r is not old]
+        if new is not None:
+            current.append(new)
+    return current
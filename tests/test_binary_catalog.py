@@ -0,0 +1,74 @@
+import struct
+
+import pytest
+from helpers import sample_rows
+
+from seed_manager import BIN_HEADER, COLUMNS, BinaryCatalog, compile_catalog, write_catalog
+
+
+@pytest.fixture
+def compiled(tmp_path):
+    csv_path = tmp_path / "seeds.csv"
+    out_path = tmp_path / "seeds.seedcat"
+    write_catalog(str(csv_path), sample_rows())
+    compile_catalog(str(csv_path), str(out_path))
+    return out_path
+
+
+def test_compiled_catalog_round_trip(compiled):
+    rows = sample_rows()
+    cat = BinaryCatalog(str(compiled))
+    try:
+        assert len(cat) == len(rows)
+        assert cat.columns == COLUMNS
+        assert [cat[i] for i in range(len(cat))] == rows
+        assert cat.names() == ["Tomato", "Basil", "Carrot", "Pepper", "Onion"]
+        assert cat.names("PE", limit=5) == ["Pepper"]
+        assert cat.names(limit=2) == ["Tomato", "Basil"]
+        assert cat.find("Basil") == rows[1]
+        assert cat.find("Okra") is None
+        with pytest.raises(IndexError):
+            cat[len(rows)]
+    finally:
+        cat.close()
+
+
+def test_other_files_are_rejected(compiled):
+    data = compiled.read_bytes()
+    compiled.write_bytes(b"NOTSEED\0" + data[8:])
+    with pytest.raises(ValueError):
+        BinaryCatalog(str(compiled))
+
+
+@pytest.mark.parametrize("damage", ["empty", "truncated", "offsets", "column names"])
+def test_corrupt_files_raise_value_error(compiled, damage):
+    data = compiled.read_bytes()
+    if damage == "empty":
+        data = b""
+    elif damage == "truncated":
+        data = data[:BIN_HEADER.size + 10]
+    elif damage == "offsets":
+        fields = list(BIN_HEADER.unpack_from(data, 0))
+        fields[-1] = len(data) * 4  # rows_off past the end of the file
+        data = BIN_HEADER.pack(*fields) + data[BIN_HEADER.size:]
+    else:
+        columns_off = BIN_HEADER.unpack_from(data, 0)[4]
+        data = data[:columns_off] + struct.pack("<H", 0xFFFF) + data[columns_off + 2:]
+    compiled.write_bytes(data)
+    with pytest.raises(ValueError):
+        BinaryCatalog(str(compiled))
+
+
+def test_out_of_range_code_raises_value_error(compiled):
+    data = bytearray(compiled.read_bytes())
+    rows_off = BIN_HEADER.unpack_from(data, 0)[-1]
+    (record,) = struct.unpack_from("<Q", data, rows_off)
+    struct.pack_into("<I", data, record, 0xFFFFFFFF)
+    compiled.write_bytes(bytes(data))
+    cat = BinaryCatalog(str(compiled))
+    try:
+        with pytest.raises(ValueError):
+            cat[0]
+        assert cat[1]["Name"] == "Basil"
+    finally:
+        cat.close()
@@ -0,0 +1,95 @@
+from helpers import sample_rows, seed
+
+import seed_manager
+from seed_manager import (
+    COLUMNS, SOURCE_KEY, SeedManagerApp, load_catalogs, read_catalog, site_label, write_catalog,
+)
+
+
+def test_single_catalog_rows_carry_their_source(tmp_path):
+    path = str(tmp_path / "home.csv")
+    write_catalog(path, sample_rows())
+    rows = load_catalogs([path])
+    assert [r["Name"] for r in rows] == [r["Name"] for r in sample_rows()]
+    assert all(r[SOURCE_KEY] == path for r in rows)
+    assert rows[0]["Pairings"] == "Basil, Carrots"
+
+
+def test_several_catalogs_merge_in_path_order(tmp_path):
+    paths = [str(tmp_path / f"site{i}.csv") for i in range(3)]
+    for i, path in enumerate(paths):
+        write_catalog(path, [seed(f"Seed {i}-{j}", Type="Herb") for j in range(i + 2)])
+    rows = load_catalogs(paths)
+    assert [r["Name"] for r in rows] == [f"Seed {i}-{j}" for i in range(3) for j in range(i + 2)]
+    assert [site_label(r[SOURCE_KEY]) for r in rows] == ["site0"] * 2 + ["site1"] * 3 + ["site2"] * 4
+
+
+def test_written_catalog_skips_private_keys(tmp_path):
+    path = str(tmp_path / "home.csv")
+    row = dict(seed("Basil"), **{SOURCE_KEY: "elsewhere.csv"})
+    write_catalog(path, [row])
+    with open(path, encoding="utf-8") as f:
+        assert SOURCE_KEY not in f.read()
+
+
+def test_read_catalog_returns_values_in_column_order(tmp_path):
+    path = tmp_path / "old.csv"
+    # columns out of order, one unknown, most missing, and a short last line
+    path.write_text("Type,Name,Extra\r\nHerb,Basil,x\r\n\r\nRoot\r\n", encoding="utf-8")
+    values = read_catalog(str(path))
+    assert values == [["Basil", "Herb"] + [""] * (len(COLUMNS) - 2), ["", "Root"] + [""] * (len(COLUMNS) - 2)]
+    rows = load_catalogs([str(path), str(path)])
+    assert rows[0] == dict(zip(COLUMNS, values[0]), **{SOURCE_KEY: str(path)})
+    assert len(rows) == 4 and rows[2] is not rows[0]
+
+
+def test_one_worker_reads_in_process(tmp_path, monkeypatch):
+    paths = [str(tmp_path / f"site{i}.csv") for i in range(3)]
+    for i, path in enumerate(paths):
+        write_catalog(path, [seed(f"Seed {i}")])
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("started a process pool for a single worker")
+
+    monkeypatch.setattr(seed_manager.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(seed_manager, "ProcessPoolExecutor", no_pool)
+    assert [r["Name"] for r in load_catalogs(paths)] == ["Seed 0", "Seed 1", "Seed 2"]
+
+
+def test_worker_pool_matches_sequential_read(tmp_path, monkeypatch):
+    paths = [str(tmp_path / f"site{i}.csv") for i in range(3)]
+    for i, path in enumerate(paths):
+        write_catalog(path, sample_rows()[i:])
+    sequential = load_catalogs(paths)
+    monkeypatch.setattr(seed_manager.os, "cpu_count", lambda: 4)
+    assert load_catalogs(paths) == sequential
+
+
+class FakeWidget(dict):
+    # enough of a Tk variable / Combobox for the dropdown code
+    value = ""
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def test_edit_dropdown_reaches_same_named_records_on_every_site():
+    home = dict(seed("Basil", Comments="home"), **{SOURCE_KEY: "/gardens/home.csv"})
+    plot = dict(seed("Basil", Comments="plot"), **{SOURCE_KEY: "/gardens/plot.csv"})
+    tomato = dict(seed("Tomato"), **{SOURCE_KEY: "/gardens/plot.csv"})
+    app = SeedManagerApp.__new__(SeedManagerApp)
+    app.data = [home, plot, tomato]
+    app.name_var, app.name_dropdown, app.pairing_dd, app.season_dd = (FakeWidget() for _ in range(4))
+    app.loaded = []
+    app.load_row_into_form = app.loaded.append
+
+    app.update_name_dropdown()
+    assert app.name_dropdown["values"] == ["Basil (home)", "Basil (plot)", "Tomato"]
+    for choice in ("Basil (plot)", "Basil (home)", "Tomato"):
+        app.name_var.set(choice)
+        app.on_name_select()
+    assert app.loaded == [plot, home, tomato]
+    assert app.selected_index == 2
@@ -0,0 +1,164 @@
+import http.client
+import json
+import socket
+import time
+
+import pytest
+
+from helpers import sample_rows, seed
+
+from seed_manager import SERVICE_CACHE_SIZE, SOURCE_KEY, CatalogService, main
+
+
+def service_with(rows):
+    service = CatalogService()
+    service.publish(rows, lambda r: r)
+    return service
+
+
+def get(service, target):
+    status, etag, body = service.respond(target)
+    return status, etag, json.loads(body)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def request(port, method, target, headers=None):
+    for _ in range(100):
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            conn.request(method, target, headers=headers or {})
+            break
+        except ConnectionRefusedError:
+            time.sleep(0.02)
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response.status, response.getheader("ETag"), body
+
+
+def test_routes():
+    rows = [dict(r, **{SOURCE_KEY: "home.csv"}) for r in sample_rows()]
+    service = service_with(rows)
+    status, _, page = get(service, "/seeds?page=2&per_page=4")
+    assert status == 200
+    assert (page["total"], page["page"], page["per_page"]) == (6, 2, 4)
+    assert [s["Name"] for s in page["seeds"]] == ["Onion", "Basil"]
+    assert page["seeds"][0]["Site"] == "home"
+
+    status, _, found = get(service, "/seeds/basil")
+    assert status == 200 and len(found["seeds"]) == 2
+    status, _, found = get(service, "/query?season=summer&type=nightshade")
+    assert [s["Name"] for s in found["seeds"]] == ["Tomato", "Pepper"]
+    status, _, found = get(service, "/query?pairing=basil")
+    assert [s["Name"] for s in found["seeds"]] == ["Tomato", "Pepper"]
+    status, _, found = get(service, "/query?pairing=onion")
+    assert [s["Name"] for s in found["seeds"]] == ["Carrot"]
+
+    assert service.respond("/seeds/okra")[0] == 404
+    assert service.respond("/nowhere")[0] == 404
+    assert service.respond("/seeds?page=x")[0] == 400
+    assert service.respond("/seeds/okra")[1] is None
+
+
+def test_etag_changes_only_with_the_content():
+    rows = sample_rows()
+    service = service_with(rows)
+    _, first, _ = service.respond("/seeds/tomato")
+    assert service.respond("/seeds/tomato")[1] == first
+    service.publish(list(rows), lambda r: r)
+    assert service.respond("/seeds/tomato")[1] == first
+    service.publish([dict(rows[0], Comments="staked")] + rows[1:], lambda r: r)
+    assert service.respond("/seeds/tomato")[1] != first
+
+
+def test_http_etag_and_not_modified():
+    port = free_port()
+    service = CatalogService(port=port)
+    service.publish([seed("Basil", Type="Herb")], lambda r: r)
+    service.start()
+
+    status, etag, body = request(port, "GET", "/seeds")
+    assert status == 200 and etag
+    assert json.loads(body)["seeds"][0]["Name"] == "Basil"
+    status, _, body = request(port, "GET", "/seeds", {"If-None-Match": etag})
+    assert (status, body) == (304, b"")
+    status, _, body = request(port, "HEAD", "/seeds")
+    assert (status, body) == (200, b"")
+
+    service.publish([seed("Basil", Type="Herb"), seed("Okra")], lambda r: r)
+    status, new_etag, _ = request(port, "GET", "/seeds", {"If-None-Match": etag})
+    assert status == 200 and new_etag != etag
+    assert request(port, "POST", "/seeds")[0] == 405
+
+
+def test_edit_drops_only_the_responses_it_can_change():
+    rows = sample_rows()
+    service = service_with(rows)
+    targets = ["/seeds/tomato", "/seeds/basil", "/seeds", "/query?type=herb", "/query?type=root",
+               "/query?season=fall"]
+    before = {t: service.respond(t) for t in targets}
+
+    edited = dict(rows[1], **{"Season/s": "Summer"})  # first Basil leaves Fall
+    rows[1] = edited
+    service.publish(rows, lambda r: r, old=sample_rows()[1], new=edited)
+    after = {t: service.respond(t) for t in targets}
+
+    for kept in ("/seeds/tomato", "/query?type=root"):
+        assert after[kept] is before[kept]
+    for dropped in ("/seeds/basil", "/seeds", "/query?type=herb", "/query?season=fall"):
+        assert after[dropped] is not before[dropped]
+    assert json.loads(after["/query?season=fall"][2])["total"] == 0
+    assert after["/seeds/basil"][1] != before["/seeds/basil"][1]
+
+
+def test_publish_without_a_record_drops_everything():
+    service = service_with(sample_rows())
+    first = service.respond("/seeds/tomato")
+    service.publish(sample_rows(), lambda r: r)
+    assert service.respond("/seeds/tomato") is not first
+
+
+def test_busy_port_is_reported_at_start():
+    with socket.socket() as busy:
+        busy.bind(("127.0.0.1", 0))
+        busy.listen()
+        port = busy.getsockname()[1]
+        with pytest.raises(OSError):
+            CatalogService(port=port).start()
+        with pytest.raises(SystemExit) as exit_info:
+            main(["--serve", str(port)])
+        assert exit_info.value.code == 1
+
+
+def test_unused_query_parameters_share_one_cache_entry():
+    service = service_with(sample_rows())
+    first = service.respond("/seeds?page=1&nocache=1")
+    for n in range(2, 50):
+        assert service.respond(f"/seeds?nocache={n}&page=1") is first
+    assert service.respond("/seeds/basil?x=1") is service.respond("/seeds/basil?x=2")
+    assert service.respond("/query?type=herb&x=1") is service.respond("/query?x=2&type=herb")
+    assert len(service._cache) == 3
+
+
+def test_error_responses_are_not_cached():
+    service = service_with(sample_rows())
+    for target in ("/seeds/okra", "/nowhere", "/seeds?page=x"):
+        service.respond(target)
+    assert len(service._cache) == 0
+
+
+def test_cache_keeps_only_the_most_recently_used_responses():
+    service = service_with(sample_rows())
+    home = service.respond("/seeds?page=1")
+    for n in range(2, SERVICE_CACHE_SIZE + 10):
+        service.respond(f"/seeds?page={n}")
+        if n % 16 == 0:
+            assert service.respond("/seeds?page=1") is home  # touched, so it stays
+    assert len(service._cache) == SERVICE_CACHE_SIZE
+    assert service.respond("/seeds?page=1") is home
+    assert ("/seeds", (("page", "2"),)) not in service._cache
@@ -0,0 +1,45 @@
+from helpers import apply_edits, edit_sequence, sample_rows, seed
+
+from seed_manager import CatalogStats, heirloom_label, parse_range
+
+
+def stats_state(stats):
+    return (stats.total, stats.by_type, stats.by_life_cycle, stats.by_season, stats.by_heirloom,
+            stats.progress, stats.averages(stats.germination), stats.averages(stats.maturity),
+            stats.summary_lines())
+
+
+def test_parse_range_and_heirloom_label():
+    assert parse_range("7-14") == (7.0, 14.0)
+    assert parse_range(" 70 ") == (70.0, 70.0)
+    assert parse_range("//") is None and parse_range("") is None
+    assert [heirloom_label(v) for v in ("Y", " yes", "n", "", "?")] == ["Yes", "Yes", "No", "Unknown", "Unknown"]
+
+
+def test_stats_count_the_catalog():
+    stats = CatalogStats(sample_rows())
+    assert stats.total == 6
+    assert stats.by_type["Nightshade"] == 2 and stats.by_type["Herb"] == 2
+    assert stats.by_season["Summer"] == 3 and stats.by_season["Fall"] == 1
+    assert stats.by_heirloom == {"Yes": 1, "No": 1, "Unknown": 4}
+    assert stats.progress["Started"] == 5 and stats.progress["Transplanted"] == 1
+    assert stats.averages(stats.germination)["Nightshade"] == (7.0, 13.0)
+    assert "Total seeds: 6" in stats.summary_lines()
+
+
+def test_catalog_stats_incremental_matches_rebuild():
+    rows = sample_rows()
+    stats = CatalogStats(rows)
+    edits = edit_sequence(rows)
+    for old, new in edits:
+        stats.update(old, new)
+
+    fresh = CatalogStats(apply_edits(rows, edits))
+    assert stats_state(stats) == stats_state(fresh)
+    assert set(stats.germination) == set(fresh.germination)
+    # removing everything leaves no averages behind
+    for row in apply_edits(rows, edits):
+        stats.remove(row)
+    assert stats.total == 0 and not stats.germination and not stats.maturity
+    stats.add(seed("Okra"))
+    assert stats.by_type["(none)"] == 1
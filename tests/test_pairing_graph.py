@@ -0,0 +1,86 @@
+from helpers import apply_edits, edit_sequence, sample_rows, seed
+
+from seed_manager import PairingGraph, pair_key, sown_in, split_pairings
+
+
+def graph_answers(graph, names):
+    return {
+        "neighbours": {n: graph.neighbours(n) for n in names},
+        "partners": {n: graph.partners(n) for n in names},
+        "all": graph.compatible_with_all(["Tomato", "Basil"]),
+        "bed": graph.bed_for(["Tomato"]),
+        "beds": graph.suggest_beds(3),
+    }
+
+
+def test_pair_key_folds_plurals_and_case():
+    assert pair_key("  Tomatoes ") == pair_key("tomato") == "tomato"
+    assert pair_key("Peaches") == "peach"
+    assert pair_key("Grass") == "grass"
+    assert split_pairings("Basil, Carrots,, ") == {"basil", "carrot"}
+
+
+def test_pairings_match_names_and_types_both_ways():
+    graph = PairingGraph(sample_rows())
+    # Tomato lists Basil; Pepper lists Basil and is a Nightshade like Tomato
+    assert graph.partners("Tomato") == ["Basil", "Carrot"]
+    assert graph.partners("Basil") == ["Pepper", "Tomato"]
+    assert graph.partners("Onion") == ["Carrot"]
+    assert graph.compatible_with_all(["Tomato", "Carrot"]) == []
+    assert graph.compatible_with_all(["Tomato", "Pepper", "Okra"]) == ["Basil"]
+    assert graph.bed_for(["Tomato"])[:1] == ["Tomato"]
+    assert "Okra" not in graph
+
+
+def test_pairing_graph_incremental_matches_rebuild():
+    rows = sample_rows()
+    graph = PairingGraph(rows)
+    names = {r["Name"] for r in rows} | {"Marigold", "Leek"}
+    graph_answers(graph, names)  # warm the caches so edits must invalidate them
+    edits = edit_sequence(rows)
+    for old, new in edits:
+        graph.update(old, new)
+
+    fresh = PairingGraph(apply_edits(rows, edits))
+    assert graph_answers(graph, names) == graph_answers(fresh, names)
+    assert graph_answers(graph.snapshot(), names) == graph_answers(fresh, names)
+    assert "Pepper" not in graph and "Onion" not in graph and "Leek" in graph
+    assert "Marigold" in graph.partners("Tomato")
+
+
+def test_duplicate_names_keep_their_pairings_until_the_last_goes():
+    first = seed("Bean", Type="Legume", Pairings="Corn")
+    second = seed("Bean", Type="Legume", Pairings="Squash")
+    graph = PairingGraph([first, second, seed("Corn"), seed("Squash")])
+    assert graph.partners("Bean") == ["Corn", "Squash"]
+    graph.remove(first)
+    assert graph.partners("Bean") == ["Squash"]
+    graph.remove(second)
+    assert "Bean" not in graph and graph.partners("Corn") == []
+
+
+def test_snapshot_is_unaffected_by_later_edits():
+    rows = sample_rows()
+    graph = PairingGraph(rows)
+    snap = graph.snapshot()
+    graph.add(seed("Marigold", Pairings="Tomato"))
+    graph.remove(rows[1])
+    assert "Marigold" in graph.partners("Tomato")
+    assert snap.partners("Tomato") == ["Basil", "Carrot"]
+    assert snap.version < graph.version
+
+
+def test_edit_keeps_cached_answers_it_cannot_affect():
+    rows = sample_rows() + [seed("Bean", Type="Legume", Pairings="Corn"), seed("Corn")]
+    graph = PairingGraph(rows)
+    beans = graph.partners("Bean")
+    tomato = graph.partners("Tomato")
+    graph.update(rows[2], dict(rows[2], Pairings="Onion"))  # Carrot stops listing Tomato
+    assert graph.partners("Bean") is beans
+    assert graph.partners("Tomato") is not tomato
+    assert graph.partners("Tomato") == ["Basil", "Carrot"]  # Tomato still lists Carrots
+
+
+def test_sown_in_reads_every_start_date():
+    row = seed("Basil", **{"Seed Started Date": "03/15/2025, 03/20/2026"})
+    assert sown_in(row, 2026) and sown_in(row, 2025) and not sown_in(row, 2024)
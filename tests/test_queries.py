@@ -0,0 +1,130 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from helpers import sample_rows, seed
+
+from seed_manager import QUERY_CHECK_EVERY, SeedManagerApp, filter_rows, sort_rows
+
+
+class FakeRoot:
+    # stands in for Tk: after() callbacks are queued and run by settle()
+    def __init__(self):
+        self.calls = []
+
+    def after(self, ms, fn, *args):
+        self.calls.append((fn, args))
+
+
+def headless_app(rows):
+    # just the query plumbing of SeedManagerApp, no widgets
+    app = SeedManagerApp.__new__(SeedManagerApp)
+    app.root = FakeRoot()
+    app.data = rows
+    app.filtered_data = list(rows)
+    app.query_pool = ThreadPoolExecutor(max_workers=2)
+    app.query_results = queue.Queue()
+    app.query_gen = 0
+    app.query_future = None
+    app.query_pending = None
+    app.query_polling = False
+    app.shown = []
+    app.refresh_table = lambda: app.shown.append([r["Name"] for r in app.filtered_data])
+    return app
+
+
+def settle(app):
+    while app.root.calls:
+        if app.query_future is not None:
+            wait([app.query_future], timeout=5)
+        fn, args = app.root.calls.pop(0)
+        fn(*args)
+
+
+def test_filter_rows_keeps_matches_and_stops_when_cancelled():
+    rows = [seed(f"Seed {i}", Type="Herb" if i % 3 else "Root") for i in range(QUERY_CHECK_EVERY * 2)]
+    kept = filter_rows(rows, lambda r: r["Type"] == "Root", lambda: False)
+    assert len(kept) == len(range(0, QUERY_CHECK_EVERY * 2, 3))
+    assert filter_rows(rows, lambda r: True, lambda: True) is None
+    checks = []
+    filter_rows(rows, lambda r: True, lambda: checks.append(1) and False)
+    assert len(checks) == 2
+    assert sort_rows(rows, lambda r: r["Name"], lambda: True) is None
+    assert sort_rows(rows[:3], lambda r: r["Name"], lambda: False) == rows[:3]
+
+
+def test_query_result_replaces_the_table():
+    app = headless_app(sample_rows())
+    app.run_query(lambda rows, cancelled: filter_rows(rows, lambda r: r["Type"] == "Nightshade", cancelled))
+    settle(app)
+    assert app.shown == [["Tomato", "Pepper"]]
+    assert not app.query_polling
+
+
+def test_newer_query_supersedes_a_running_one():
+    app = headless_app(sample_rows())
+    release = threading.Event()
+
+    def slow(rows, cancelled):
+        release.wait(5)
+        return filter_rows(rows, lambda r: True, cancelled)
+
+    app.run_query(slow)
+    app.run_query(lambda rows, cancelled: filter_rows(rows, lambda r: r["Name"] == "Onion", cancelled))
+    release.set()
+    settle(app)
+    assert app.shown == [["Onion"]]
+
+
+def test_cancelled_query_never_reaches_the_table():
+    app = headless_app(sample_rows())
+    release = threading.Event()
+    app.run_query(lambda rows, cancelled: release.wait(5) and list(rows))
+    app.cancel_queries()
+    release.set()
+    settle(app)
+    assert app.shown == []
+
+
+def test_sorts_order_the_current_result():
+    app = headless_app(sample_rows())
+    app.filtered_data = [r for r in app.data if r["Type"] != "Herb"]
+    app.sort_by_name()
+    settle(app)
+    app.sort_by_type()
+    settle(app)
+    assert app.shown == [["Carrot", "Onion", "Pepper", "Tomato"], ["Onion", "Pepper", "Tomato", "Carrot"]]
+
+
+def test_sort_applies_to_a_search_still_running():
+    app = headless_app(sample_rows())
+    release = threading.Event()
+
+    def slow_search(rows, cancelled):
+        release.wait(5)
+        return filter_rows(rows, lambda r: r["Type"] != "Herb", cancelled)
+
+    app.run_query(slow_search)
+    app.sort_by_type()
+    app.sort_by_name()
+    release.set()
+    settle(app)
+    assert app.shown == [["Carrot", "Onion", "Pepper", "Tomato"]]
+    assert app.query_pending is None
+
+    # with nothing pending, a sort reorders what the table shows
+    app.sort_by_type()
+    settle(app)
+    assert app.shown[-1] == ["Onion", "Pepper", "Tomato", "Carrot"]
+
+
+def test_sort_after_a_cancelled_query_uses_the_table_rows():
+    app = headless_app(sample_rows())
+    app.filtered_data = app.data[:2]
+    release = threading.Event()
+    app.run_query(lambda rows, cancelled: release.wait(5) and list(rows))
+    app.cancel_queries()
+    app.sort_by_name()
+    release.set()
+    settle(app)
+    assert app.shown == [["Basil", "Tomato"]]
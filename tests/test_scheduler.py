@@ -0,0 +1,113 @@
+import datetime
+
+import pytest
+
+from helpers import apply_edits, edit_sequence, sample_rows, seed
+
+from seed_manager import SOURCE_KEY, PlantingScheduler, planting_events
+
+TODAY = datetime.date(2026, 4, 1)
+
+
+def day(text):
+    return datetime.datetime.strptime(text, "%m/%d/%Y").date()
+
+
+def test_events_follow_the_record_dates():
+    tomato, _, carrot, _, onion, _ = sample_rows()
+    assert planting_events(tomato, TODAY) == [(day("04/12/2026"), "Transplant"), (day("06/21/2026"), "Harvest")]
+    assert planting_events(carrot, TODAY) == [(day("04/10/2026"), "Transplant"), (day("06/19/2026"), "Harvest")]
+    assert planting_events(onion, TODAY) == [(day("07/01/2026"), "Harvest")]
+    # typed dates that already passed are not reminders any more
+    assert planting_events(dict(carrot, **{"Transplant Date": "03/01/2026"}), TODAY)[:1] == [
+        (day("05/10/2026"), "Harvest")]
+    assert planting_events(seed("Okra"), TODAY) == []
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf", "1e308", "99999"])
+def test_unusable_spans_are_ignored(value):
+    row = seed("Okra", **{"Seed Started Date": "03/01/2026", "Transplant Timeframe (weeks)": value,
+                          "Time to Maturity": value})
+    assert planting_events(row, TODAY) == []
+    assert PlantingScheduler([row], today=TODAY).pop_due(datetime.date.max) == []
+
+
+def test_transplant_timeframe_ranges_use_the_earliest_week():
+    row = seed("Pepper", **{"Seed Started Date": "03/01/2026", "Transplant Timeframe (weeks)": "6-8",
+                            "Time to Maturity": "60-90"})
+    assert planting_events(row, TODAY) == [(day("04/12/2026"), "Transplant"), (day("06/11/2026"), "Harvest")]
+    assert planting_events(dict(row, **{"Transplant Timeframe (weeks)": "about 6"}), TODAY) == [
+        (day("04/30/2026"), "Harvest")]
+
+
+def test_recorded_harvest_retires_the_transplant_reminder():
+    tomato = sample_rows()[0]
+    assert planting_events(dict(tomato, **{"Harvest Date": "03/30/2026"}), TODAY) == []
+    assert planting_events(dict(tomato, **{"Harvest Date": "08/01/2026"}), TODAY) == [
+        (day("08/01/2026"), "Harvest")]
+
+
+def test_long_overdue_reminders_are_treated_as_done():
+    old = seed("Pea", **{"Seed Started Date": "03/01/2025", "Transplant Timeframe (weeks)": "4",
+                         "Time to Maturity": "60"})
+    assert planting_events(old, TODAY) == []
+    recent = dict(old, **{"Seed Started Date": "01/01/2026"})
+    # the transplant (01/29) is past the window, the harvest it implies is not
+    assert planting_events(recent, TODAY) == [(day("03/30/2026"), "Harvest")]
+
+
+def test_pop_due_returns_events_in_date_order_once():
+    scheduler = PlantingScheduler(sample_rows()[:5], today=TODAY)
+    due = scheduler.pop_due(day("04/30/2026"))
+    assert [(d, kind, row["Name"]) for d, kind, row in due] == [
+        (day("03/29/2026"), "Transplant", "Pepper"), (day("04/10/2026"), "Transplant", "Carrot"), (day("04/12/2026"), "Transplant", "Tomato")]
+    assert scheduler.pop_due(day("04/30/2026")) == []
+
+
+def test_planting_scheduler_incremental_matches_rebuild():
+    rows = [dict(r, **{SOURCE_KEY: "seeds.csv"}) for r in sample_rows()]
+    # give the second Basil reminders of its own
+    rows[5].update({"Seed Started Date": "03/10/2026", "Transplant Timeframe (weeks)": "3"})
+    scheduler = PlantingScheduler(rows, today=TODAY)
+    edits = edit_sequence(rows)
+    for old, new in edits:
+        scheduler.update(old, new)
+    # churn the same record so stale heap entries pile up
+    current = edits[0][1]
+    for weeks in range(1, 40):
+        new = dict(current, **{"Transplant Timeframe (weeks)": str(weeks % 6 + 1)})
+        scheduler.update(current, new)
+        current = new
+    final = apply_edits(rows, edits)
+    final = [current if r is edits[0][1] else r for r in final]
+
+    fresh = PlantingScheduler(final, today=TODAY)
+    horizon = TODAY + datetime.timedelta(days=365)
+    due = scheduler.pop_due(horizon)
+    assert due == fresh.pop_due(horizon)
+    assert "Onion" not in {row["Name"] for _, _, row in due}
+    assert (day("04/10/2026"), "Transplant", rows[2]) in due
+    assert (day("03/31/2026"), "Transplant", rows[5]) in due
+    assert scheduler.pop_due(horizon) == []
+    assert len(scheduler._heap) <= 2 * scheduler._live + 64
+
+
+def test_same_named_records_keep_their_own_reminders():
+    first = seed("Basil", **{SOURCE_KEY: "seeds.csv", "Seed Started Date": "03/15/2026",
+                             "Transplant Timeframe (weeks)": "2"})
+    second = dict(first, **{"Seed Started Date": "03/20/2026"})
+    horizon = day("04/30/2026")
+
+    scheduler = PlantingScheduler([first, second], today=TODAY)
+    assert scheduler.pop_due(horizon) == [(day("03/29/2026"), "Transplant", first),
+                                          (day("04/03/2026"), "Transplant", second)]
+
+    scheduler = PlantingScheduler([first, second], today=TODAY)
+    scheduler.remove(second)
+    assert scheduler.pop_due(horizon) == [(day("03/29/2026"), "Transplant", first)]
+
+    scheduler = PlantingScheduler([first, second], today=TODAY)
+    edited = dict(first, **{"Transplant Date": "04/20/2026"})
+    scheduler.update(first, edited)
+    assert scheduler.pop_due(horizon) == [(day("04/03/2026"), "Transplant", second),
+                                          (day("04/20/2026"), "Transplant", edited)]
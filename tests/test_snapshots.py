@@ -0,0 +1,125 @@
+import os
+
+from helpers import seed
+
+from seed_manager import SnapshotStore
+
+
+def many_rows(count):
+    return [seed(f"Seed {i:04d}", Type=f"Type {i % 7}", Comments=f"note {i}") for i in range(count)]
+
+
+def test_snapshot_record_and_rows(tmp_path):
+    catalog = str(tmp_path / "seeds.csv")
+    store = SnapshotStore(str(tmp_path))
+    version = store.record(catalog, many_rows(300))
+    assert version is not None
+    assert store.versions(catalog) == [version]
+    assert store.rows(catalog, version) == many_rows(300)
+    # nothing changed -> no new version, even from a fresh store
+    assert store.record(catalog, many_rows(300)) is None
+    store.close()
+    reopened = SnapshotStore(str(tmp_path))
+    try:
+        assert reopened.record(catalog, many_rows(300)) is None
+        assert reopened.versions(catalog) == [version]
+        assert len(reopened.rows(catalog, version)) == 300
+    finally:
+        reopened.close()
+
+
+def test_snapshot_versions_share_unchanged_blocks(tmp_path):
+    catalog = str(tmp_path / "seeds.csv")
+    store = SnapshotStore(str(tmp_path))
+    rows = many_rows(2000)
+    first = store.record(catalog, rows)
+    objects = len(store._index)
+    pack_size = os.path.getsize(os.path.join(store.root, "objects.pack"))
+
+    rows[1000] = dict(rows[1000], Comments="edited")
+    second = store.record(catalog, rows)
+    assert second is not None and second != first
+    # one new row plus the few blocks on its path to the root
+    assert len(store._index) - objects < 10
+    assert os.path.getsize(os.path.join(store.root, "objects.pack")) - pack_size < 4096
+    assert store.rows(catalog, first)[1000]["Comments"] == "note 1000"
+    assert store.rows(catalog, second)[1000]["Comments"] == "edited"
+
+
+def test_snapshot_diff(tmp_path):
+    catalog = str(tmp_path / "seeds.csv")
+    store = SnapshotStore(str(tmp_path))
+    rows = many_rows(500)
+    first = store.record(catalog, rows)
+    rows[10] = dict(rows[10], Comments="edited", Type="Changed")
+    del rows[20]
+    rows.insert(300, seed("Okra"))
+    second = store.record(catalog, rows)
+    assert store.diff(catalog, first, second) == {
+        "added": ["Okra"], "removed": ["Seed 0020"], "changed": [("Seed 0010", ["Type", "Comments"])]}
+    assert store.diff(catalog, second, second) == {"added": [], "removed": [], "changed": []}
+
+
+def test_catalogs_in_one_directory_keep_separate_histories(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    home, plot = str(tmp_path / "home.csv"), str(tmp_path / "plot.csv")
+    store.record(home, many_rows(5))
+    store.record(plot, many_rows(5))
+    assert store.record(plot, many_rows(6)) is not None
+    assert (len(store.versions(home)), len(store.versions(plot))) == (1, 2)
+
+
+def test_snapshot_copied_row_is_rehashed(tmp_path):
+    # dict(row, ...) copies the cached hash along with the fields
+    catalog = str(tmp_path / "seeds.csv")
+    store = SnapshotStore(str(tmp_path))
+    try:
+        rows = many_rows(50)
+        first = store.record(catalog, rows)
+        rows[3] = dict(rows[3], Type="Changed")
+        second = store.record(catalog, rows)
+        assert second is not None
+        assert store.diff(catalog, first, second)["changed"] == [("Seed 0003", ["Type"])]
+    finally:
+        store.close()
+
+
+def test_snapshot_records_the_full_text(tmp_path):
+    catalog = str(tmp_path / "seeds.csv")
+    store = SnapshotStore(str(tmp_path))
+    try:
+        short = seed("Basil", Comments="see notes")
+        version = store.record(catalog, [short], expand=lambda r: dict(r, Comments="the whole note"))
+        assert store.rows(catalog, version)[0]["Comments"] == "the whole note"
+    finally:
+        store.close()
+
+
+def test_snapshot_diff_with_duplicate_names(tmp_path):
+    catalog = str(tmp_path / "seeds.csv")
+    store = SnapshotStore(str(tmp_path))
+    try:
+        rows = [seed("Basil", Type="Herb", Comments="a"), seed("Basil", Type="Herb", Comments="b"),
+                seed("Tomato", Type="Nightshade")]
+        first = store.record(catalog, rows)
+        rows = [rows[0], dict(rows[1], Comments="c"), seed("Basil", Type="Herb", Comments="d"), seed("Okra")]
+        second = store.record(catalog, rows)
+        assert store.diff(catalog, first, second) == {
+            "added": ["Basil", "Okra"], "removed": ["Tomato"], "changed": [("Basil", ["Comments"])]}
+        assert store.diff(catalog, second, first) == {
+            "added": ["Tomato"], "removed": ["Basil", "Okra"], "changed": [("Basil", ["Comments"])]}
+    finally:
+        store.close()
+
+
+def test_snapshot_identical_rows_are_not_lost(tmp_path):
+    catalog = str(tmp_path / "seeds.csv")
+    store = SnapshotStore(str(tmp_path))
+    try:
+        twin = seed("Radish", Type="Root")
+        first = store.record(catalog, [twin, dict(twin)])
+        second = store.record(catalog, [twin])
+        assert store.rows(catalog, first) == [seed("Radish", Type="Root")] * 2
+        assert store.diff(catalog, first, second)["removed"] == ["Radish"]
+    finally:
+        store.close()
@@ -0,0 +1,60 @@
+from helpers import seed
+
+from seed_manager import OFFLINE_TEXT_MIN, PREVIEW_CHARS, TEXT_REF_KEY, TextStore, preview
+
+
+def test_preview_cuts_long_text():
+    assert preview("short") == "short"
+    long_text = "word " * 40
+    assert preview(long_text).endswith("…")
+    assert len(preview(long_text)) <= PREVIEW_CHARS + 1
+
+
+def test_long_fields_move_to_the_side_file():
+    store = TextStore()
+    notes = "Pinch the flowers before they set seed. " * 50
+    uses = "Pesto, " * 300
+    row = store.externalize(seed("Basil", Comments=notes, Uses=uses, Benefits="Repels flies"))
+    assert row["Comments"] == preview(notes)
+    assert row["Benefits"] == "Repels flies"
+    assert store.fetch(row, "Comments") == notes
+    assert store.fetch(row, "Uses") == uses
+    assert store.fetch(row, "Benefits") == "Repels flies"
+
+    full = store.expand(row)
+    assert full is not row
+    assert (full["Comments"], full["Uses"], full["Benefits"]) == (notes, uses, "Repels flies")
+    assert row["Comments"] == preview(notes)
+
+
+def test_short_rows_are_left_alone():
+    store = TextStore()
+    row = seed("Carrot", Comments="thin early")
+    assert store.externalize(row) == seed("Carrot", Comments="thin early")
+    assert store.expand(row) is row
+
+
+def test_re_externalizing_an_edited_row_drops_old_text():
+    store = TextStore()
+    row = store.externalize(seed("Basil", Comments="x" * 2000))
+    edited = store.externalize(dict(store.expand(row), Comments="now short"))
+    assert store.fetch(edited, "Comments") == "now short"
+    assert store.expand(edited)["Comments"] == "now short"
+
+
+def test_moderately_long_text_stays_inline():
+    store = TextStore()
+    text = "y" * (PREVIEW_CHARS + 10)
+    row = store.externalize(seed("Basil", Comments=text, Uses=text))
+    assert TEXT_REF_KEY not in row and row["Comments"] == text
+    assert store.expand(row) is row
+
+
+def test_offloaded_fields_share_one_ref():
+    store = TextStore()
+    long_text = "z" * OFFLINE_TEXT_MIN
+    row = store.externalize(seed("Basil", Comments=long_text, Issues="aphids " * 20, Benefits="short"))
+    assert isinstance(row[TEXT_REF_KEY], int)
+    assert store.get(row[TEXT_REF_KEY]) == {"Comments": long_text, "Issues": "aphids " * 20}
+    # Pairings is never offloaded, so fetch reads it straight from the row
+    assert store.fetch(dict(row, Pairings="Tomato"), "Pairings") == "Tomato"